@@ -17,7 +17,6 @@ from podcastfy.utils.config import Config, load_config
 from podcastfy.utils.config_conversation import load_conversation_config
 from podcastfy.utils.logger import setup_logger
 from typing import List, Optional, Dict, Any
-import copy
 
 import logging
 
@@ -39,6 +38,21 @@ app = typer.Typer()
 os.environ["LANGCHAIN_TRACING_V2"] = "False"
 
 
+def _create_text_to_speech(tts_model: str, config: Config, conv_config) -> TextToSpeech:
+    """
+    Create the TextToSpeech converter for the given model, looking up its API key.
+    """
+    api_key = None
+    if tts_model != "edge":
+        api_key = getattr(config, f"{tts_model.upper().replace('MULTI', '')}_API_KEY")
+
+    return TextToSpeech(
+        model=tts_model,
+        api_key=api_key,
+        conversation_config=conv_config.to_dict(),
+    )
+
+
 def process_content(
     urls: Optional[List[str]] = None,
     transcript_file: Optional[str] = None,
@@ -52,10 +66,14 @@ def process_content(
     model_name: Optional[str] = None,
     api_key_label: Optional[str] = None,
     topic: Optional[str] = None,
-    longform: bool = False
+    longform: bool = False,
+    stream: bool = False
 ):
     """
     Process URLs, a transcript file, image paths, or raw text to generate a podcast or transcript.
+
+    With stream enabled, standard (non-longform) podcasts are synthesized turn by turn
+    while the transcript is still being generated.
     """
     try:
         if config is None:
@@ -71,6 +89,14 @@ def process_content(
         tts_config = conv_config.get("text_to_speech", {})
         output_directories = tts_config.get("output_directories", {})
 
+        # Create output directories up front so a missing one can't fail the final save
+        if not transcript_file:
+            transcripts_dir = output_directories.get("transcripts", "data/transcripts")
+            os.makedirs(transcripts_dir, exist_ok=True)
+        if generate_audio:
+            audio_dir = output_directories.get("audio", "data/audio")
+            os.makedirs(audio_dir, exist_ok=True)
+
         if transcript_file:
             logger.info(f"Using transcript file: {transcript_file}")
             with open(transcript_file, "r") as file:
@@ -92,7 +118,7 @@ def process_content(
             
             if urls:
                 logger.info(f"Processing {len(urls)} links")
-                contents = [content_extractor.extract_content(link) for link in urls]
+                contents = content_extractor.extract_contents(urls)
                 combined_content += "\n\n".join(contents)
 
             if text:
@@ -109,10 +135,23 @@ def process_content(
 
             # Generate Q&A content using output directory from conversation config
             random_filename = f"transcript_{uuid.uuid4().hex}.txt"
-            transcript_filepath = os.path.join(
-                output_directories.get("transcripts", "data/transcripts"),
-                random_filename,
-            )
+            transcript_filepath = os.path.join(transcripts_dir, random_filename)
+
+            if stream and generate_audio and not longform:
+                # Stream the transcript into TTS so synthesis overlaps with generation
+                text_to_speech = _create_text_to_speech(tts_model, config, conv_config)
+                audio_file = os.path.join(audio_dir, f"podcast_{uuid.uuid4().hex}.mp3")
+                text_to_speech.convert_to_speech_stream(
+                    content_generator.stream_qa_content(
+                        combined_content,
+                        image_file_paths=image_paths or [],
+                        output_filepath=transcript_filepath
+                    ),
+                    audio_file
+                )
+                logger.info(f"Podcast generated successfully using {tts_model} TTS model")
+                return audio_file
+
             qa_content = content_generator.generate_qa_content(
                 combined_content,
                 image_file_paths=image_paths or [],
@@ -121,20 +160,10 @@ def process_content(
             )
 
         if generate_audio:
-            api_key = None
-            if tts_model != "edge":
-                api_key = getattr(config, f"{tts_model.upper().replace('MULTI', '')}_API_KEY")
-
-            text_to_speech = TextToSpeech(
-                model=tts_model,
-                api_key=api_key,
-                conversation_config=conv_config.to_dict(),
-            )
+            text_to_speech = _create_text_to_speech(tts_model, config, conv_config)
 
             random_filename = f"podcast_{uuid.uuid4().hex}.mp3"
-            audio_file = os.path.join(
-                output_directories.get("audio", "data/audio"), random_filename
-            )
+            audio_file = os.path.join(audio_dir, random_filename)
             text_to_speech.convert_to_speech(qa_content, audio_file)
             logger.info(f"Podcast generated successfully using {tts_model} TTS model")
             return audio_file
@@ -198,6 +227,11 @@ def main(
         "-lf", 
         help="Generate long-form content (only available for text input without images)"
     ),
+    stream: bool = typer.Option(
+        False,
+        "--stream",
+        help="Synthesize audio while the transcript is being generated (standard form only)"
+    ),
 ):
     """
     Generate a podcast or transcript from a list of URLs, a file containing URLs, a transcript file, image files, or raw text.
@@ -231,7 +265,8 @@ def main(
                 model_name=llm_model_name,
                 api_key_label=api_key_label,
                 topic=topic,
-                longform=longform
+                longform=longform,
+                stream=stream
             )
         else:
             urls_list = urls or []
@@ -255,7 +290,8 @@ def main(
                 model_name=llm_model_name,
                 api_key_label=api_key_label,
                 topic=topic,
-                longform=longform
+                longform=longform,
+                stream=stream
             )
 
         if transcript_only:
@@ -289,6 +325,7 @@ def generate_podcast(
     api_key_label: Optional[str] = None,
     topic: Optional[str] = None,
     longform: bool = False,
+    stream: bool = False,
 ) -> Optional[str]:
     """
     Generate a podcast or transcript from a list of URLs, a file containing URLs, a transcript file, or image files.
@@ -307,30 +344,27 @@ def generate_podcast(
         llm_model_name (Optional[str]): LLM model name for content generation.
         api_key_label (Optional[str]): Environment variable name for LLM API key.
         topic (Optional[str]): Topic to generate podcast about.
+        stream (bool): Synthesize audio while the transcript is being generated. Defaults to False.
 
     Returns:
         Optional[str]: Path to the final podcast audio file, or None if only generating a transcript.
     """
     try:
         print("Generating podcast...")
-        # Load default config
-        default_config = load_config()
-
         # Update config if provided
-        if config:
-            if isinstance(config, dict):
-                # Create a deep copy of the default config
-                updated_config = copy.deepcopy(default_config)
-                # Update the copy with user-provided values
-                updated_config.configure(**config)
-                default_config = updated_config
-            elif isinstance(config, Config):
-                # If it's already a Config object, use it directly
-                default_config = config
-            else:
-                raise ValueError(
-                    "Config must be either a dictionary or a Config object"
-                )
+        if isinstance(config, Config):
+            # If it's already a Config object, use it directly
+            default_config = config
+        elif not config or isinstance(config, dict):
+            # Load default config; each load returns a fresh copy of the settings
+            default_config = load_config()
+            if config:
+                # Update it with user-provided values
+                default_config.configure(**config)
+        else:
+            raise ValueError(
+                "Config must be either a dictionary or a Config object"
+            )
 
         if not conversation_config:
             conversation_config = load_conversation_config().to_dict()
@@ -355,7 +389,8 @@ def generate_podcast(
                 model_name=llm_model_name,
                 api_key_label=api_key_label,
                 topic=topic,
-                longform=longform
+                longform=longform,
+                stream=stream
             )
         else:
             urls_list = urls or []
@@ -381,7 +416,8 @@ def generate_podcast(
                 model_name=llm_model_name,
                 api_key_label=api_key_label,
                 topic=topic,
-                longform=longform
+                longform=longform,
+                stream=stream
             )
 
     except Exception as e:
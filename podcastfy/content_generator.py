@@ -6,25 +6,204 @@ LangChain and various LLM backends. It handles the interaction with the AI model
 provides methods to generate and save the generated content.
 """
 
+import asyncio
+import functools
 import os
-from typing import Optional, Dict, Any, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, List, AsyncIterator, Iterator, Tuple
 import re
 
 
-from langchain_community.chat_models import ChatLiteLLM
-from langchain_google_genai import ChatGoogleGenerativeAI
-from langchain_community.llms.llamafile import Llamafile
-from langchain_core.prompts import ChatPromptTemplate
+from langchain_core.messages import BaseMessage
+from langchain_core.prompts import ChatPromptTemplate, HumanMessagePromptTemplate
 from langchain_core.output_parsers import StrOutputParser
-from langchain import hub
 from podcastfy.utils.config_conversation import load_conversation_config
 from podcastfy.utils.config import load_config
+from podcastfy.utils.cache import MemoryCache, ResponseCache, SQLiteCache, hash_file
 import logging
-from langchain.prompts import HumanMessagePromptTemplate
 from abc import ABC, abstractmethod
 
 logger = logging.getLogger(__name__)
 
+# Transcript cleaning patterns, compiled once as they run over every generated transcript
+SCRATCHPAD_PATTERN = re.compile(r'```scratchpad\n.*?```\n?|```plaintext\n.*?```\n?|```\n?|\[.*?\]', re.DOTALL)
+XML_BEFORE_CLOSING_TAG_PATTERN = re.compile(r"xml(?=\s*</Person[12]>)")
+UNDERSCORE_EMPHASIS_PATTERN = re.compile(r'_(.*?)_')
+PERSON_BLOCK_PATTERN = re.compile(r'(<Person[12]>.*?</Person[12]>)', re.DOTALL)
+PERSON_TURN_PATTERN = re.compile(r'<Person([12])>(.*?)</Person\1>', re.DOTALL)
+SPEAKER_OPENING_TAG_PATTERN = re.compile(r'<Person[12]>')
+SUPPORTED_SSML_TAGS = ("speak", "lang", "p", "phoneme", "s", "sub")
+
+
+@functools.lru_cache(maxsize=8)
+def _markup_patterns(additional_tags: Tuple[str, ...]) -> Tuple[re.Pattern, re.Pattern]:
+    """
+    Compile the patterns used by _clean_tss_markup for a given set of speaker tags.
+
+    Returns:
+        Tuple: Pattern matching unsupported tags, blank lines (including any unsupported
+        tags within them) and asterisks in a single scan, and pattern matching each
+        speaker tag's content up to the next speaker tag
+    """
+    unsupported_tag = r"</?(?!(?:" + "|".join(SUPPORTED_SSML_TAGS + additional_tags) + r")\b)[^>]+>"
+    markup = re.compile(
+        rf"(?P<blanks>\n(?:\s|{unsupported_tag})*\n)|(?P<tag>{unsupported_tag})|(?P<star>\*)"
+    )
+    speakers = "|".join(additional_tags)
+    speaker_content = re.compile(f'<({speakers})>(.*?)(?=<(?:{speakers})>|$)', re.DOTALL)
+    return markup, speaker_content
+
+
+def _replace_markup(match: re.Match) -> str:
+    """Collapse blank lines to a single newline and drop everything else matched."""
+    return "\n" if match.lastgroup == "blanks" else ""
+
+
+@functools.lru_cache(maxsize=16)
+def _pull_prompt(reference: str):
+    """
+    Pull a prompt template from LangChain Hub, at most once per "template:commit" reference.
+    """
+    # Imported on first use only, as it loads the full langchain package
+    from langchain import hub
+
+    return hub.pull(reference)
+
+
+class CacheBreakpointPromptTemplate(HumanMessagePromptTemplate):
+    """
+    Human message template whose formatted content ends with an Anthropic cache_control
+    breakpoint.
+
+    The breakpoint is added after formatting, as the pinned langchain-core drops extra
+    keys such as cache_control from templated content blocks.
+    """
+
+    def format(self, **kwargs: Any) -> BaseMessage:
+        return self._with_breakpoint(super().format(**kwargs))
+
+    async def aformat(self, **kwargs: Any) -> BaseMessage:
+        return self._with_breakpoint(await super().aformat(**kwargs))
+
+    @staticmethod
+    def _with_breakpoint(message: BaseMessage) -> BaseMessage:
+        content = message.content
+        blocks = [content] if isinstance(content, str) else list(content)
+        blocks = [
+            {"type": "text", "text": block} if isinstance(block, str) else dict(block)
+            for block in blocks
+        ]
+        blocks[-1]["cache_control"] = {"type": "ephemeral"}
+        return message.model_copy(update={"content": blocks})
+
+
+class CachedChain:
+    """
+    Wraps a prompt | llm | parser chain and memoizes its outputs.
+
+    Entries are keyed by model, temperature and the fully rendered prompt, so the
+    same cache serves standard generation and every long-form part. Local image
+    files are keyed by content so renamed files still hit the cache.
+    """
+
+    def __init__(self, chain, prompt_template: ChatPromptTemplate, cache, model_name: str, temperature: float):
+        """
+        Initialize CachedChain.
+
+        Args:
+            chain: The LangChain chain producing string outputs
+            prompt_template (ChatPromptTemplate): Prompt at the head of the chain
+            cache: Cache backend providing get(key) and set(key, value)
+            model_name (str): Name of the model behind the chain
+            temperature (float): Sampling temperature of the model
+        """
+        self.chain = chain
+        self.prompt_template = prompt_template
+        self.cache = cache
+        self.model_name = model_name
+        self.temperature = temperature
+
+    def _key(self, prompt_params: Dict[str, Any]) -> str:
+        """Build the cache key for a set of prompt parameters."""
+        params = dict(prompt_params)
+        # hashlib releases the GIL on large inputs, so images are hashed on a thread pool
+        image_keys = [
+            key for key, value in prompt_params.items()
+            if key.startswith("image_path_") and os.path.isfile(value)
+        ]
+        if image_keys:
+            with ThreadPoolExecutor(max_workers=min(8, len(image_keys))) as executor:
+                digests = executor.map(hash_file, [prompt_params[key] for key in image_keys])
+                params.update(zip(image_keys, digests))
+
+        prompt = self.prompt_template.invoke(params).to_string()
+        return ResponseCache.make_key(self.model_name, self.temperature, prompt)
+
+    def _get(self, key: str) -> Optional[str]:
+        cached = self.cache.get(key)
+        if cached is None:
+            return None
+        logger.info("LLM response loaded from cache")
+        return cached.decode("utf-8")
+
+    def invoke(self, prompt_params: Dict[str, Any], config=None, **kwargs) -> str:
+        """Return the cached output for prompt_params, invoking the chain on a miss."""
+        key = self._key(prompt_params)
+        response = self._get(key)
+        if response is None:
+            response = self.chain.invoke(prompt_params, config, **kwargs)
+            self.cache.set(key, response.encode("utf-8"))
+        return response
+
+    async def ainvoke(self, prompt_params: Dict[str, Any], config=None, **kwargs) -> str:
+        """Return the cached output for prompt_params, awaiting the chain on a miss."""
+        key = self._key(prompt_params)
+        response = self._get(key)
+        if response is None:
+            response = await self.chain.ainvoke(prompt_params, config, **kwargs)
+            self.cache.set(key, response.encode("utf-8"))
+        return response
+
+    def batch(self, inputs: List[Dict[str, Any]], config=None, **kwargs) -> List[str]:
+        """Return cached outputs where available and batch the remaining inputs."""
+        keys = [self._key(prompt_params) for prompt_params in inputs]
+        responses = [self._get(key) for key in keys]
+        misses = [i for i, response in enumerate(responses) if response is None]
+        if misses:
+            outputs = self.chain.batch([inputs[i] for i in misses], config, **kwargs)
+            for i, output in zip(misses, outputs):
+                self.cache.set(keys[i], output.encode("utf-8"))
+                responses[i] = output
+        return responses
+
+    def stream(self, prompt_params: Dict[str, Any], config=None, **kwargs) -> Iterator[str]:
+        """Stream the chain output, replaying a cached output as a single chunk."""
+        key = self._key(prompt_params)
+        response = self._get(key)
+        if response is not None:
+            yield response
+            return
+
+        chunks = []
+        for chunk in self.chain.stream(prompt_params, config, **kwargs):
+            chunks.append(chunk)
+            yield chunk
+        self.cache.set(key, "".join(chunks).encode("utf-8"))
+
+    async def astream(self, prompt_params: Dict[str, Any], config=None, **kwargs) -> AsyncIterator[str]:
+        """Asynchronously stream the chain output, replaying a cached output as a single chunk."""
+        key = self._key(prompt_params)
+        response = self._get(key)
+        if response is not None:
+            yield response
+            return
+
+        chunks = []
+        async for chunk in self.chain.astream(prompt_params, config, **kwargs):
+            chunks.append(chunk)
+            yield chunk
+        self.cache.set(key, "".join(chunks).encode("utf-8"))
+
 
 class LLMBackend:
     def __init__(
@@ -56,11 +235,15 @@ class LLMBackend:
             "frequency_penalty": 0.75,  # Avoid repetition
         }
 
+        # Backends are imported on demand as each pulls in a heavy dependency tree
         if is_local:
+            from langchain_community.llms.llamafile import Llamafile
+
             self.llm = Llamafile() # replace with ollama
         elif (
             "gemini" in self.model_name.lower()
         ):  # keeping original gemini as a special case while we build confidence on LiteLLM
+            from langchain_google_genai import ChatGoogleGenerativeAI
 
             self.llm = ChatGoogleGenerativeAI(
                 api_key=os.environ["GEMINI_API_KEY"],
@@ -69,6 +252,8 @@ class LLMBackend:
                 **common_params,
             )
         else:  # user should set api_key_label from input
+            from langchain_community.chat_models import ChatLiteLLM
+
             self.llm = ChatLiteLLM(
                 model=self.model_name,
                 temperature=temperature,
@@ -76,6 +261,52 @@ class LLMBackend:
             )
 
 
+def get_llm_backend(
+    is_local: bool,
+    temperature: float,
+    max_output_tokens: int,
+    model_name: str,
+    api_key_label: str = "GEMINI_API_KEY",
+) -> LLMBackend:
+    """
+    Get an LLMBackend for the given settings, reusing one built earlier in the process.
+
+    Sharing backends across ContentGenerator instances keeps the LLM client and its
+    HTTP connections alive between podcasts instead of reconnecting for each one.
+    The API key read from the environment is part of the cache key, so a rotated or
+    newly set key gets a new backend.
+    """
+    if is_local:
+        api_key = None
+    elif "gemini" in model_name.lower():
+        api_key = os.environ.get("GEMINI_API_KEY")
+    else:
+        api_key = os.environ.get(api_key_label)
+
+    return _cached_llm_backend(
+        is_local, temperature, max_output_tokens, model_name, api_key_label, api_key
+    )
+
+
+@functools.lru_cache(maxsize=32)
+def _cached_llm_backend(
+    is_local: bool,
+    temperature: float,
+    max_output_tokens: int,
+    model_name: str,
+    api_key_label: str,
+    api_key: Optional[str],
+) -> LLMBackend:
+    """Build an LLMBackend once per settings and API key."""
+    return LLMBackend(
+        is_local=is_local,
+        temperature=temperature,
+        max_output_tokens=max_output_tokens,
+        model_name=model_name,
+        api_key_label=api_key_label,
+    )
+
+
 class LongFormContentGenerator:
     """
     Handles generation of long-form podcast conversations by breaking content into manageable chunks.
@@ -98,6 +329,33 @@ class LongFormContentGenerator:
         6. Maintain consistent voice throughout the extended discussion
         7. Generate a long conversation - output max_output_tokens tokens
     """
+
+    # Part-specific instructions, built once rather than for every part
+    COMMON_INSTRUCTIONS = """
+            Podcast conversation so far is given in CONTEXT.
+            Continue the natural flow of conversation. Follow-up on the very previous point/question without repeating topics or points already discussed!
+            Hence, the transition should be smooth and natural. Avoid abrupt transitions.
+            Make sure the first to speak is different from the previous speaker. Look at the last tag in CONTEXT to determine the previous speaker. 
+            If last tag in CONTEXT is <Person1>, then the first to speak now should be <Person2>.
+            If last tag in CONTEXT is <Person2>, then the first to speak now should be <Person1>.
+            This is a live conversation without any breaks.
+            Hence, avoid statemeents such as "we'll discuss after a short break.  Stay tuned" or "Okay, so, picking up where we left off".
+        """
+    INTRODUCTION_INSTRUCTIONS = """
+            ALWAYS START THE CONVERSATION GREETING THE AUDIENCE: Welcome to {podcast_name} - {podcast_tagline}.
+            You are generating the Introduction part of a long podcast conversation.
+            Don't cover any topics yet, just introduce yourself and the topic. Leave the rest for later parts, following these guidelines:
+            """
+    MIDDLE_INSTRUCTIONS = f"""
+            You are generating part {{part_number}} of {{total_parts}} parts of a long podcast conversation.
+            {COMMON_INSTRUCTIONS}
+            For this part, discuss the below INPUT in a podcast conversation format, following these guidelines:
+            """
+    CONCLUSION_INSTRUCTIONS = f"""
+            You are generating the last part of a long podcast conversation. 
+            {COMMON_INSTRUCTIONS}
+            For this part, discuss the below INPUT and then make concluding remarks in a podcast conversation format and END THE CONVERSATION GREETING THE AUDIENCE WITH PERSON1 ALSO SAYING A GOOD BYE MESSAGE, following these guidelines:
+            """
     
     def __init__(self, chain, llm, config_conversation: Dict[str, Any], ):
         """
@@ -111,6 +369,8 @@ class LongFormContentGenerator:
         self.llm = llm
         self.max_num_chunks = config_conversation.get("max_num_chunks", 10)  # Default if not in config
         self.min_chunk_size = config_conversation.get("min_chunk_size", 200)  # Default if not in config
+        self.max_parallel_chunks = config_conversation.get("max_parallel_chunks", 1)  # 1 keeps parts sequential
+        self.max_context_size = config_conversation.get("max_context_size", 0)  # 0 keeps the whole conversation
 
     def __calculate_chunk_size(self, input_content: str) -> int:
         """
@@ -147,22 +407,29 @@ class LongFormContentGenerator:
         Returns:
             List[str]: List of content chunks
         """
-        sentences = input_content.split('. ')
+        # Walk sentence boundaries by offset and slice chunks out of the input directly,
+        # rather than materializing every sentence and joining them back together
         chunks = []
-        current_chunk = []
+        chunk_start = 0
+        chunk_end = None
         current_length = 0
-        
-        for sentence in sentences:
-            sentence_length = len(sentence)
-            if current_length + sentence_length > chunk_size and current_chunk:
-                chunks.append('. '.join(current_chunk) + '.')
-                current_chunk = []
+        sentence_start = 0
+
+        while True:
+            separator = input_content.find('. ', sentence_start)
+            sentence_end = separator if separator != -1 else len(input_content)
+            sentence_length = sentence_end - sentence_start
+            if current_length + sentence_length > chunk_size and chunk_end is not None:
+                chunks.append(input_content[chunk_start:chunk_end] + '.')
+                chunk_start = sentence_start
                 current_length = 0
-            current_chunk.append(sentence)
             current_length += sentence_length
-            
-        if current_chunk:
-            chunks.append('. '.join(current_chunk) + '.')
+            chunk_end = sentence_end
+            if separator == -1:
+                break
+            sentence_start = separator + 2
+
+        chunks.append(input_content[chunk_start:chunk_end] + '.')
         return chunks
 
     def enhance_prompt_params(self, prompt_params: Dict, 
@@ -181,42 +448,17 @@ class LongFormContentGenerator:
         Returns:
             Dict: Enhanced prompt parameters with part-specific instructions
         """
-        enhanced_params = prompt_params.copy()
-		# Initialize part_instructions with chat context
-        enhanced_params["context"] = chat_context
-        
-        COMMON_INSTRUCTIONS = """
-            Podcast conversation so far is given in CONTEXT.
-            Continue the natural flow of conversation. Follow-up on the very previous point/question without repeating topics or points already discussed!
-            Hence, the transition should be smooth and natural. Avoid abrupt transitions.
-            Make sure the first to speak is different from the previous speaker. Look at the last tag in CONTEXT to determine the previous speaker. 
-            If last tag in CONTEXT is <Person1>, then the first to speak now should be <Person2>.
-            If last tag in CONTEXT is <Person2>, then the first to speak now should be <Person1>.
-            This is a live conversation without any breaks.
-            Hence, avoid statemeents such as "we'll discuss after a short break.  Stay tuned" or "Okay, so, picking up where we left off".
-        """ 
-
-        # Add part-specific instructions
         if part_idx == 0:
-            enhanced_params["instruction"] = f"""
-            ALWAYS START THE CONVERSATION GREETING THE AUDIENCE: Welcome to {enhanced_params["podcast_name"]} - {enhanced_params["podcast_tagline"]}.
-            You are generating the Introduction part of a long podcast conversation.
-            Don't cover any topics yet, just introduce yourself and the topic. Leave the rest for later parts, following these guidelines:
-            """
+            instruction = self.INTRODUCTION_INSTRUCTIONS.format(
+                podcast_name=prompt_params["podcast_name"],
+                podcast_tagline=prompt_params["podcast_tagline"]
+            )
         elif part_idx == total_parts - 1:
-            enhanced_params["instruction"] = f"""
-            You are generating the last part of a long podcast conversation. 
-            {COMMON_INSTRUCTIONS}
-            For this part, discuss the below INPUT and then make concluding remarks in a podcast conversation format and END THE CONVERSATION GREETING THE AUDIENCE WITH PERSON1 ALSO SAYING A GOOD BYE MESSAGE, following these guidelines:
-            """
+            instruction = self.CONCLUSION_INSTRUCTIONS
         else:
-            enhanced_params["instruction"] = f"""
-            You are generating part {part_idx+1} of {total_parts} parts of a long podcast conversation.
-            {COMMON_INSTRUCTIONS}
-            For this part, discuss the below INPUT in a podcast conversation format, following these guidelines:
-            """
-        
-        return enhanced_params
+            instruction = self.MIDDLE_INSTRUCTIONS.format(part_number=part_idx + 1, total_parts=total_parts)
+
+        return {**prompt_params, "context": chat_context, "instruction": instruction}
 
     def generate_long_form(
         self, 
@@ -241,23 +483,18 @@ class LongFormContentGenerator:
 
         chunks = self.chunk_content(input_content, chunk_size)
         conversation_parts = []
-        chat_context = input_content
         num_parts = len(chunks)
         print(f"Generating {num_parts} parts")
+
+        if self.max_parallel_chunks > 1 and num_parts > 2:
+            return self.stitch_conversations(
+                self.__generate_parts_in_parallel(chunks, prompt_params, input_content)
+            )
         
         for i, chunk in enumerate(chunks):
-            enhanced_params = self.enhance_prompt_params(
-                prompt_params,
-                part_idx=i,
-                total_parts=num_parts,
-                chat_context=chat_context
-            )
-            enhanced_params["input_text"] = chunk
+            chat_context = self.__context_from(conversation_parts) if i > 0 else input_content
+            enhanced_params = self.__part_params(prompt_params, chunk, i, num_parts, chat_context)
             response = self.llm_chain.invoke(enhanced_params)
-            if i == 0:
-                chat_context = response
-            else:
-                chat_context = chat_context + response
             print(f"Generated part {i+1}/{num_parts}: Size {len(chunk)} characters.")
             #print(f"[LLM-START] Step: {i+1} ##############################")
             #print(response)
@@ -266,6 +503,89 @@ class LongFormContentGenerator:
 
         return self.stitch_conversations(conversation_parts)
     
+    def __context_from(self, conversation_parts: List[str]) -> str:
+        """
+        Build the context for the next part from the most recent conversation parts,
+        up to max_context_size characters.
+
+        Bounding the context keeps each part's prompt from growing with every part
+        generated before it. Only the parts that fall within the window are joined,
+        and the window starts at a speaker tag so the previous speaker can still be
+        determined.
+        """
+        if not self.max_context_size:
+            return "".join(conversation_parts)
+
+        start = len(conversation_parts)
+        window_size = 0
+        while start > 0 and window_size < self.max_context_size:
+            start -= 1
+            window_size += len(conversation_parts[start])
+
+        chat_context = "".join(conversation_parts[start:])
+        if len(chat_context) <= self.max_context_size:
+            return chat_context
+        window = chat_context[-self.max_context_size:]
+        tag_start = window.find("<Person")
+        return window[tag_start:] if tag_start != -1 else window
+
+    def __part_params(self, prompt_params: Dict, chunk: str, part_idx: int,
+                      total_parts: int, chat_context: str) -> Dict:
+        """
+        Build the prompt parameters for one conversation part.
+        """
+        enhanced_params = self.enhance_prompt_params(
+            prompt_params,
+            part_idx=part_idx,
+            total_parts=total_parts,
+            chat_context=chat_context
+        )
+        enhanced_params["input_text"] = chunk
+        return enhanced_params
+
+    def __generate_parts_in_parallel(self, chunks: List[str], prompt_params: Dict,
+                                     chat_context: str) -> List[str]:
+        """
+        Generate conversation parts with the middle parts running concurrently.
+
+        The introduction is generated first and serves as context for every middle
+        part, which are then generated together with at most max_parallel_chunks
+        requests in flight. The last part sees the whole conversation so far, so it
+        can wrap up what was discussed.
+
+        Args:
+            chunks (List[str]): Content chunks, one per conversation part
+            prompt_params (Dict): Base prompt parameters
+            chat_context (str): Context for the introduction
+
+        Returns:
+            List[str]: Generated conversation parts in order
+        """
+        num_parts = len(chunks)
+        introduction = self.llm_chain.invoke(
+            self.__part_params(prompt_params, chunks[0], 0, num_parts, chat_context)
+        )
+        print(f"Generated part 1/{num_parts}: Size {len(chunks[0])} characters.")
+
+        middle_parts = self.llm_chain.batch(
+            [
+                self.__part_params(prompt_params, chunk, i, num_parts, introduction)
+                for i, chunk in enumerate(chunks[1:-1], 1)
+            ],
+            config={"max_concurrency": self.max_parallel_chunks}
+        )
+        print(f"Generated parts 2-{num_parts - 1}/{num_parts}")
+
+        conclusion = self.llm_chain.invoke(
+            self.__part_params(
+                prompt_params, chunks[-1], num_parts - 1, num_parts,
+                self.__context_from([introduction, *middle_parts])
+            )
+        )
+        print(f"Generated part {num_parts}/{num_parts}: Size {len(chunks[-1])} characters.")
+
+        return [introduction, *middle_parts, conclusion]
+
     def stitch_conversations(self, parts: List[str]) -> str:
         """
         Combine conversation parts with smooth transitions.
@@ -296,13 +616,11 @@ class ContentCleanerMixin:
         Remove scratchpad blocks, plaintext blocks, standalone triple backticks, any string enclosed in brackets, and underscores around words.
         """
         try:
-            import re
-            pattern = r'```scratchpad\n.*?```\n?|```plaintext\n.*?```\n?|```\n?|\[.*?\]'
-            cleaned_text = re.sub(pattern, '', text, flags=re.DOTALL)
+            cleaned_text = SCRATCHPAD_PATTERN.sub('', text)
             # Remove "xml" if followed by </Person1> or </Person2>
-            cleaned_text = re.sub(r"xml(?=\s*</Person[12]>)", "", cleaned_text)
+            cleaned_text = XML_BEFORE_CLOSING_TAG_PATTERN.sub("", cleaned_text)
             # Remove underscores around words
-            cleaned_text = re.sub(r'_(.*?)_', r'\1', cleaned_text)
+            cleaned_text = UNDERSCORE_EMPHASIS_PATTERN.sub(r'\1', cleaned_text)
             return cleaned_text.strip()
         except Exception as e:
             logger.error(f"Error cleaning scratchpad content: {str(e)}")
@@ -318,23 +636,10 @@ class ContentCleanerMixin:
         """
         try:
             input_text = ContentCleanerMixin._clean_scratchpad(input_text)
-            supported_tags = ["speak", "lang", "p", "phoneme", "s", "sub"]
-            supported_tags.extend(additional_tags)
-
-            pattern = r"</?(?!(?:" + "|".join(supported_tags) + r")\b)[^>]+>"
-            cleaned_text = re.sub(pattern, "", input_text)
-            cleaned_text = re.sub(r"\n\s*\n", "\n", cleaned_text)
-            cleaned_text = re.sub(r"\*", "", cleaned_text)
-
-            for tag in additional_tags:
-                cleaned_text = re.sub(
-                    f'<{tag}>(.*?)(?=<(?:{"|".join(additional_tags)})>|$)',
-                    f"<{tag}>\\1</{tag}>",
-                    cleaned_text,
-                    flags=re.DOTALL,
-                )
-            
+            markup_pattern, speaker_pattern = _markup_patterns(tuple(additional_tags))
 
+            cleaned_text = markup_pattern.sub(_replace_markup, input_text)
+            cleaned_text = speaker_pattern.sub(r"<\1>\2</\1>", cleaned_text)
 
             return cleaned_text.strip()
             
@@ -342,6 +647,52 @@ class ContentCleanerMixin:
             logger.error(f"Error cleaning TSS markup: {str(e)}")
             return input_text
 
+    @staticmethod
+    def _is_stable_cut(text: str) -> bool:
+        """
+        Check whether text, followed by a speaker opening tag, cleans the same whatever comes next.
+
+        That holds when no scratchpad or plaintext block, bracketed span, underscore
+        emphasis or markup tag is left open at the end of text, as those are the only
+        cleaning patterns able to match across a speaker opening tag.
+
+        Args:
+            text (str): Transcript text up to a speaker opening tag
+
+        Returns:
+            bool: Whether the text can be cleaned before the rest of the transcript is known
+        """
+        for match in SCRATCHPAD_PATTERN.finditer(text):
+            # A block still waiting for its closing fence only loses its opening backticks
+            if match.group() in ("```", "```\n") and text.startswith(
+                ("```scratchpad\n", "```plaintext\n"), match.start()
+            ):
+                return False
+        remaining = SCRATCHPAD_PATTERN.sub("", text)
+
+        last_line = remaining[remaining.rfind("\n") + 1:]
+        return (
+            "[" not in remaining
+            and last_line.count("_") % 2 == 0
+            and remaining.rfind("<") <= remaining.rfind(">")
+        )
+
+    @staticmethod
+    def _clean_tss_markup_prefix(text: str) -> str:
+        """
+        Clean the start of a transcript, as _clean_tss_markup cleans it within the full transcript.
+
+        Args:
+            text (str): Transcript text up to a speaker opening tag, for which
+                _is_stable_cut holds
+
+        Returns:
+            str: The start of the cleaned full transcript
+        """
+        # Stands in for the speaker turn that follows text in the full transcript
+        cleaned = ContentCleanerMixin._clean_tss_markup(text + "<Person1>\0</Person1>")
+        return cleaned[:cleaned.rfind("<Person1>\0")]
+
 
 class ContentGenerationStrategy(ABC):
     """
@@ -381,6 +732,32 @@ class ContentGenerationStrategy(ABC):
         """Compose prompt parameters according to strategy."""
         pass
 
+    @staticmethod
+    def _compose_conversation_params(config_conversation: Dict[str, Any]) -> Dict[str, Any]:
+        """Compose the prompt parameters taken from the conversation configuration."""
+        return {
+            "conversation_style": ", ".join(
+                config_conversation.get("conversation_style", [])
+            ),
+            "roles_person1": config_conversation.get("roles_person1"),
+            "roles_person2": config_conversation.get("roles_person2"),
+            "dialogue_structure": ", ".join(
+                config_conversation.get("dialogue_structure", [])
+            ),
+            "podcast_name": config_conversation.get("podcast_name"),
+            "podcast_tagline": config_conversation.get("podcast_tagline"),
+            "output_language": config_conversation.get("output_language"),
+            "engagement_techniques": ", ".join(
+                config_conversation.get("engagement_techniques", [])
+            ),
+        }
+
+    def _conversation_params(self, config_conversation: Dict[str, Any]) -> Dict[str, Any]:
+        """Get conversation prompt parameters, reusing those composed at initialization."""
+        if config_conversation is self.config_conversation:
+            return dict(self.conversation_params)
+        return self._compose_conversation_params(config_conversation)
+
 
 class StandardContentStrategy(ContentGenerationStrategy, ContentCleanerMixin):
     """
@@ -401,6 +778,8 @@ class StandardContentStrategy(ContentGenerationStrategy, ContentCleanerMixin):
         self.llm = llm
         self.content_generator_config = content_generator_config
         self.config_conversation = config_conversation
+        # Conversation settings are fixed per strategy, so join them once
+        self.conversation_params = self._compose_conversation_params(config_conversation)
     
     def validate(self, input_texts: str, image_file_paths: List[str]) -> None:
         """No specific validation needed for standard content."""
@@ -428,20 +807,7 @@ class StandardContentStrategy(ContentGenerationStrategy, ContentCleanerMixin):
         """Compose prompt parameters for standard content generation."""
         prompt_params = {
             "input_text": input_texts,
-            "conversation_style": ", ".join(
-                config_conversation.get("conversation_style", [])
-            ),
-            "roles_person1": config_conversation.get("roles_person1"),
-            "roles_person2": config_conversation.get("roles_person2"),
-            "dialogue_structure": ", ".join(
-                config_conversation.get("dialogue_structure", [])
-            ),
-            "podcast_name": config_conversation.get("podcast_name"),
-            "podcast_tagline": config_conversation.get("podcast_tagline"),
-            "output_language": config_conversation.get("output_language"),
-            "engagement_techniques": ", ".join(
-                config_conversation.get("engagement_techniques", [])
-            ),
+            **self._conversation_params(config_conversation),
         }
 
         # Add image paths to parameters if any
@@ -474,6 +840,8 @@ class LongFormContentStrategy(ContentGenerationStrategy, ContentCleanerMixin):
         self.llm = llm
         self.content_generator_config = content_generator_config
         self.config_conversation = config_conversation
+        # Conversation settings are fixed per strategy, so join them once
+        self.conversation_params = self._compose_conversation_params(config_conversation)
     
     def validate(self, input_texts: str, image_file_paths: List[str]) -> None:
         """Validate inputs for long-form generation."""
@@ -529,86 +897,6 @@ class LongFormContentStrategy(ContentGenerationStrategy, ContentCleanerMixin):
         return final_transcript
 
          
-    def _clean_transcript_response_DEPRECATED(self, transcript: str, config: Dict[str, Any]) -> str:
-        """
-        Clean transcript using a two-step process with LLM-based cleaning.
-        
-        First cleans the markup using a specialized prompt template, then rewrites
-        for better flow and consistency using a second prompt template.
-        
-        Args:
-            transcript (str): Raw transcript text that may contain scratchpad blocks
-            config (Dict[str, Any]): Configuration dictionary containing LLM and prompt settings
-            
-        Returns:
-            str: Cleaned and rewritten transcript with proper tags and improved flow
-            
-        Note:
-            Falls back to original or partially cleaned transcript if any cleaning step fails
-        """
-        logger.debug("Starting transcript cleaning process")
-        try:
-            logger.debug("Initializing LLM model for cleaning")
-            # Initialize model with config values for consistent cleaning
-            #llm = ChatGoogleGenerativeAI(
-            #    model=self.content_generator_config["meta_llm_model"],
-            #    temperature=0,
-            #    presence_penalty=0.75,  # Encourage diverse content
-            #    frequency_penalty=0.75  # Avoid repetition
-            #)
-            llm = self.llm
-            logger.debug("LLM model initialized successfully")
-
-            # Get prompt templates from hub
-            logger.debug("Pulling prompt templates from hub")
-            try:
-                clean_transcript_prompt = hub.pull(f"{self.content_generator_config['cleaner_prompt_template']}:{self.content_generator_config['cleaner_prompt_commit']}")
-                rewrite_prompt = hub.pull(f"{self.content_generator_config['rewriter_prompt_template']}:{self.content_generator_config['rewriter_prompt_commit']}")
-                logger.debug("Successfully pulled prompt templates")
-            except Exception as e:
-                logger.error(f"Error pulling prompt templates: {str(e)}")
-                return transcript
-            
-            logger.debug("Creating cleaning and rewriting chains")
-            # Create chains
-            clean_chain = clean_transcript_prompt | llm | StrOutputParser()
-            rewrite_chain = rewrite_prompt | llm | StrOutputParser()
-            
-            # Run cleaning chain
-            logger.debug("Executing cleaning chain")
-            try:
-                cleaned_response = clean_chain.invoke({"transcript": transcript})
-                if not cleaned_response:
-                    logger.warning("Cleaning chain returned empty response")
-                    return transcript
-                logger.debug("Successfully cleaned transcript")
-            except Exception as e:
-                logger.error(f"Error in cleaning chain: {str(e)}")
-                return transcript
-            
-            # Run rewriting chain
-            logger.debug("Executing rewriting chain")
-            try:
-                rewritten_response = rewrite_chain.invoke({"transcript": cleaned_response})
-                if not rewritten_response:
-                    logger.warning("Rewriting chain returned empty response")
-                    return cleaned_response  # Fall back to cleaned version
-                logger.debug("Successfully rewrote transcript")
-            except Exception as e:
-                logger.error(f"Error in rewriting chain: {str(e)}")
-                return cleaned_response  # Fall back to cleaned version
-                
-            # Fix alternating tags in the final response
-            logger.debug("Fixing alternating tags")
-            final_transcript = self._fix_alternating_tags(rewritten_response)
-            logger.debug("Completed transcript cleaning process")
-            
-            return final_transcript
-            
-        except Exception as e:
-            logger.error(f"Error in transcript cleaning process: {str(e)}")
-            return transcript  # Return original if cleaning fails
-
     def _fix_alternating_tags(self, transcript: str) -> str:
         """
         Ensures transcript has properly alternating Person1 and Person2 tags.
@@ -635,20 +923,14 @@ class LongFormContentStrategy(ContentGenerationStrategy, ContentCleanerMixin):
             Returns original transcript if cleaning fails
         """
         try:
-            # Split into individual tag blocks while preserving tags
-            pattern = r'(<Person[12]>.*?</Person[12]>)'
-            blocks = re.split(pattern, transcript, flags=re.DOTALL)
-            
-            # Filter out empty/whitespace blocks
-            blocks = [b.strip() for b in blocks if b.strip()]
-            
             merged_blocks = []
             current_content = []
             current_person = None
             
-            for block in blocks:
+            # Scan tag blocks in a single pass; text between blocks is dropped
+            for block in PERSON_BLOCK_PATTERN.finditer(transcript):
                 # Extract person number and content
-                match = re.match(r'<Person([12])>(.*?)</Person\1>', block, re.DOTALL)
+                match = PERSON_TURN_PATTERN.match(block.group(0))
                 if not match:
                     continue
                     
@@ -684,22 +966,61 @@ class LongFormContentStrategy(ContentGenerationStrategy, ContentCleanerMixin):
                             image_path_keys: List[str] = [],
                             input_texts: str = "") -> Dict[str, Any]:
         """Compose prompt parameters for long-form content generation."""
-        return {
-            "conversation_style": ", ".join(
-                config_conversation.get("conversation_style", [])
-            ),
-            "roles_person1": config_conversation.get("roles_person1"),
-            "roles_person2": config_conversation.get("roles_person2"),
-            "dialogue_structure": ", ".join(
-                config_conversation.get("dialogue_structure", [])
-            ),
-            "podcast_name": config_conversation.get("podcast_name"),
-            "podcast_tagline": config_conversation.get("podcast_tagline"),
-            "output_language": config_conversation.get("output_language"),
-            "engagement_techniques": ", ".join(
-                config_conversation.get("engagement_techniques", [])
-            ),
-        }
+        return self._conversation_params(config_conversation)
+
+
+class TranscriptStreamCleaner:
+    """
+    Cleans a transcript incrementally as the LLM streams it.
+
+    The streamed text is cut right before speaker turns at which the cleaning patterns
+    have nothing left open, and the text before each cut is cleaned as it would be within
+    the full transcript. Joining the pieces returned by feed and finish therefore gives
+    exactly the same text as cleaning the whole response with the strategy.
+    """
+
+    def __init__(self, strategy: ContentGenerationStrategy, config: Dict[str, Any]):
+        """
+        Initialize TranscriptStreamCleaner.
+
+        Args:
+            strategy (ContentGenerationStrategy): Strategy whose clean method gives the full transcript
+            config (Dict[str, Any]): Configuration passed to the strategy's clean method
+        """
+        self.strategy = strategy
+        self.config = config
+        self.buffer = ""
+        self.cut = 0
+        self.cleaned_length = 0
+        self.scanned = 0
+
+    def feed(self, chunk: str) -> str:
+        """
+        Add streamed text and return the cleaned transcript text it completes, if any.
+        """
+        self.buffer += chunk
+        cut = self.cut
+        for match in SPEAKER_OPENING_TAG_PATTERN.finditer(self.buffer, self.scanned):
+            if match.start() > cut and ContentCleanerMixin._is_stable_cut(self.buffer[:match.start()]):
+                cut = match.start()
+        # Tags starting before this point are complete and were checked above
+        self.scanned = max(self.scanned, len(self.buffer) - len("<Person1>") + 1)
+
+        if cut == self.cut:
+            return ""
+        self.cut = cut
+        return self.__take(ContentCleanerMixin._clean_tss_markup_prefix(self.buffer[:cut]))
+
+    def finish(self) -> str:
+        """
+        Return the rest of the cleaned transcript once the stream has ended.
+        """
+        return self.__take(self.strategy.clean(self.buffer, self.config))
+
+    def __take(self, cleaned: str) -> str:
+        piece = cleaned[self.cleaned_length:]
+        self.cleaned_length = len(cleaned)
+        return piece
 
 
 class ContentGenerator:
@@ -714,10 +1035,11 @@ class ContentGenerator:
         Initialize the ContentGenerator.
 
         Args:
-                api_key (str): API key for Google's Generative AI.
+                is_local (bool): Whether to use a local LLM or not.
+                model_name (str): Model name to use for generation.
+                api_key_label (str): Environment variable name for API key.
                 conversation_config (Optional[Dict[str, Any]]): Custom conversation configuration.
         """
-        #os.environ["GOOGLE_API_KEY"] = api_key
         self.config = load_config()
         self.content_generator_config = self.config.get("content_generator", {})
 
@@ -730,8 +1052,8 @@ class ContentGenerator:
         # Create output directories if they don't exist
         transcripts_dir = self.output_directories.get("transcripts")
 
-        if transcripts_dir and not os.path.exists(transcripts_dir):
-            os.makedirs(transcripts_dir)
+        if transcripts_dir:
+            os.makedirs(transcripts_dir, exist_ok=True)
         
         self.is_local = is_local
 
@@ -740,8 +1062,9 @@ class ContentGenerator:
             model_name = self.content_generator_config.get("llm_model")
         if is_local:
             model_name = "User provided local model"
+        self.model_name = model_name
 
-        llm_backend = LLMBackend(
+        llm_backend = get_llm_backend(
             is_local=is_local,
             temperature=self.config_conversation.get("creativity", 1),
             max_output_tokens=self.content_generator_config.get(
@@ -752,8 +1075,21 @@ class ContentGenerator:
         )
 
         self.llm = llm_backend.llm
+        self.composed_prompts: Dict[Tuple[int, bool], Tuple[ChatPromptTemplate, List[str]]] = {}
 
-
+        llm_cache = self.content_generator_config.get("llm_cache", "disk")
+        if llm_cache == "disk":
+            self.response_cache = ResponseCache(
+                self.content_generator_config.get("response_cache_dir", "data/cache/responses")
+            )
+        elif llm_cache == "sqlite":
+            self.response_cache = SQLiteCache(
+                self.content_generator_config.get("response_cache_path", "data/cache/responses.db")
+            )
+        elif llm_cache == "memory":
+            self.response_cache = MemoryCache()
+        else:
+            self.response_cache = None
 
         # Initialize strategies with configs
         self.strategies = {
@@ -769,9 +1105,9 @@ class ContentGenerator:
             )
         }
 
-    def __compose_prompt(self, num_images: int, longform: bool=False):
+    def __prompt_reference(self, longform: bool=False) -> str:
         """
-        Compose the prompt for the LLM based on the content list.
+        Get the "template:commit" reference of the prompt template to use.
         """
         content_generator_config = self.config.get("content_generator", {})
         
@@ -787,7 +1123,25 @@ class ContentGenerator:
             template = base_template
             commit = base_commit
 
-        prompt_template = hub.pull(f"{template}:{commit}")
+        return f"{template}:{commit}"
+
+    def __compose_prompt(self, num_images: int, longform: bool=False):
+        """
+        Compose the prompt for the LLM based on the content list.
+
+        The composed prompt only depends on the number of images and the prompt
+        variant, so it is built once per combination and reused.
+        """
+        if (num_images, longform) not in self.composed_prompts:
+            self.composed_prompts[(num_images, longform)] = self.__build_prompt(num_images, longform)
+        prompt_template, image_path_keys = self.composed_prompts[(num_images, longform)]
+        return prompt_template, list(image_path_keys)
+
+    def __build_prompt(self, num_images: int, longform: bool=False):
+        """
+        Build the prompt from the hub template, user instructions and image slots.
+        """
+        prompt_template = _pull_prompt(self.__prompt_reference(longform))
 
         image_path_keys = []
         messages = []
@@ -823,9 +1177,17 @@ class ContentGenerator:
             prompt_template.messages[0].prompt.template + "\n" + user_instructions
         )
 
+        if not self.is_local and "claude" in self.model_name.lower():
+            # Anthropic caches the prompt prefix up to a cache_control breakpoint. The
+            # instructions are the same for every episode, so the breakpoint goes after
+            # them and before the input text.
+            system_message = CacheBreakpointPromptTemplate.from_template(new_system_message)
+        else:
+            system_message = new_system_message
+
         # Compose messages from podcastfy_prompt_template and user_prompt_template
         combined_messages = (
-            ChatPromptTemplate.from_messages([new_system_message]).messages
+            ChatPromptTemplate.from_messages([system_message]).messages
             + user_prompt_template.messages
         )
 
@@ -834,12 +1196,79 @@ class ContentGenerator:
 
         return composed_prompt_template, image_path_keys
 
+    def __prepare_generation(
+        self,
+        input_texts: str,
+        image_file_paths: List[str],
+        longform: bool,
+        use_cache: Optional[bool] = None
+    ) -> Tuple[ContentGenerationStrategy, Dict[str, Any]]:
+        """
+        Validate inputs, build the chain and compose prompt parameters.
+
+        The chain is wrapped in a response cache when use_cache is True, or when it is
+        None and the model samples deterministically (creativity of 0).
+
+        Returns:
+            Tuple[ContentGenerationStrategy, Dict[str, Any]]: Selected strategy and prompt parameters
+        """
+        # Get appropriate strategy
+        strategy = self.strategies[longform]
+
+        # Validate inputs for chosen strategy
+        strategy.validate(input_texts, image_file_paths)
+
+        image_path_keys = self.__prepare_chain(
+            self.__num_prompt_images(image_file_paths), longform, use_cache
+        )
+
+        # Prepare parameters using strategy
+        prompt_params = strategy.compose_prompt_params(
+            self.config_conversation,
+            image_file_paths,
+            image_path_keys,
+            input_texts
+        )
+        return strategy, prompt_params
+
+    def __num_prompt_images(self, image_file_paths: List[str]) -> int:
+        """
+        Return the number of image slots in the prompt; local models ignore images.
+        """
+        return 0 if self.is_local else len(image_file_paths)
+
+    def __prepare_chain(
+        self,
+        num_images: int,
+        longform: bool,
+        use_cache: Optional[bool] = None
+    ) -> List[str]:
+        """
+        Build the chain for a prompt with num_images image slots.
+
+        Returns:
+            List[str]: Prompt keys of the image slots
+        """
+        self.prompt_template, image_path_keys = self.__compose_prompt(num_images, longform)
+        self.parser = StrOutputParser()
+        self.chain = self.prompt_template | self.llm | self.parser
+
+        temperature = self.config_conversation.get("creativity", 1)
+        if use_cache is None:
+            use_cache = temperature == 0
+        if use_cache and self.response_cache is not None:
+            self.chain = CachedChain(
+                self.chain, self.prompt_template, self.response_cache, self.model_name, temperature
+            )
+        return image_path_keys
+
     def generate_qa_content(
         self,
         input_texts: str = "",
         image_file_paths: List[str] = [],
         output_filepath: Optional[str] = None,
-        longform: bool = False
+        longform: bool = False,
+        use_cache: Optional[bool] = None
     ) -> str:
         """
         Generate Q&A content based on input texts.
@@ -852,6 +1281,9 @@ class ContentGenerator:
             model_name (str): Model name to use for generation.
             api_key_label (str): Environment variable name for API key.
             longform (bool): Whether to generate long-form content. Defaults to False.
+            use_cache (Optional[bool]): Whether to reuse LLM responses previously generated from
+                identical prompts, and store new ones for reuse. Defaults to None, which caches
+                only when creativity is 0.
 
         Returns:
             str: Generated conversation content
@@ -861,25 +1293,8 @@ class ContentGenerator:
             Exception: If there's an error in generating content.
         """
         try:
-            # Get appropriate strategy
-            strategy = self.strategies[longform]
-            
-            # Validate inputs for chosen strategy
-            strategy.validate(input_texts, image_file_paths)
-
-            # Setup chain
-            num_images = 0 if self.is_local else len(image_file_paths)
-            self.prompt_template, image_path_keys = self.__compose_prompt(num_images, longform)
-            self.parser = StrOutputParser()
-            self.chain = self.prompt_template | self.llm | self.parser
-
-
-            # Prepare parameters using strategy
-            prompt_params = strategy.compose_prompt_params(
-                self.config_conversation,
-                image_file_paths,
-                image_path_keys,
-                input_texts
+            strategy, prompt_params = self.__prepare_generation(
+                input_texts, image_file_paths, longform, use_cache
             )
 
             # Generate content using selected strategy
@@ -895,17 +1310,320 @@ class ContentGenerator:
                 self.content_generator_config
             )
                 
-            logger.info(f"Content generated successfully")
+            logger.info("Content generated successfully")
 
             # Save output if requested
             if output_filepath:
-                with open(output_filepath, "w") as file:
-                    file.write(self.response)
-                logger.info(f"Response content saved to {output_filepath}")
-                print(f"Transcript saved to {output_filepath}")
+                self.__save_response(self.response, output_filepath)
+                logger.info("Response content saved to %s", output_filepath)
 
             return self.response
             
         except Exception as e:
-            logger.error(f"Error generating content: {str(e)}")
+            logger.error("Error generating content: %s", e)
+            raise
+
+    async def agenerate_qa_content(
+        self,
+        input_texts: str = "",
+        image_file_paths: List[str] = [],
+        output_filepath: Optional[str] = None,
+        longform: bool = False,
+        use_cache: Optional[bool] = None
+    ) -> str:
+        """
+        Asynchronously generate Q&A content based on input texts.
+
+        Awaits the LLM instead of blocking on it, so several podcasts can be generated
+        concurrently from one event loop. Long-form generation chains its calls per
+        content chunk and runs in a worker thread. Progress is reported through the
+        logger only, so concurrent generations do not contend for stdout.
+
+        Args:
+            input_texts (str): Input texts to generate content from.
+            image_file_paths (List[str]): List of image file paths.
+            output_filepath (Optional[str]): Filepath to save the response content.
+            longform (bool): Whether to generate long-form content. Defaults to False.
+            use_cache (Optional[bool]): Whether to reuse LLM responses previously generated from
+                identical prompts, and store new ones for reuse. Defaults to None, which caches
+                only when creativity is 0.
+
+        Returns:
+            str: Generated conversation content
+
+        Raises:
+            ValueError: If strategy validation fails
+            Exception: If there's an error in generating content.
+        """
+        try:
+            strategy, prompt_params = self.__prepare_generation(
+                input_texts, image_file_paths, longform, use_cache
+            )
+            # Other calls may rebuild self.chain while this one is awaiting
+            chain = self.chain
+
+            if longform:
+                response = await asyncio.to_thread(strategy.generate, chain, input_texts, prompt_params)
+            else:
+                response = await chain.ainvoke(prompt_params)
+            self.response = strategy.clean(response, self.content_generator_config)
+
+            logger.info("Content generated successfully")
+
+            if output_filepath:
+                await asyncio.to_thread(self.__save_response, self.response, output_filepath)
+                logger.info("Response content saved to %s", output_filepath)
+
+            return self.response
+
+        except Exception as e:
+            logger.error("Error generating content: %s", e)
+            raise
+
+    @staticmethod
+    def __save_response(response: str, output_filepath: str) -> None:
+        with open(output_filepath, "w") as file:
+            file.write(response)
+
+    def generate_qa_content_batch(
+        self,
+        inputs: List[Dict[str, Any]],
+        max_concurrency: Optional[int] = None
+    ) -> List[str]:
+        """
+        Generate Q&A content for several independent inputs in batched LLM calls.
+
+        Inputs sharing the same number of images share a prompt, so the chain is
+        built once per group and sent a single chain.batch call instead of one
+        invoke per input. Local models ignore images, so all inputs form one group.
+        Long-form generation is not batched as it chains calls per content chunk.
+
+        Args:
+            inputs (List[Dict[str, Any]]): One dict per podcast with optional
+                "input_texts" and "image_file_paths" keys.
+            max_concurrency (Optional[int]): Maximum number of concurrent LLM requests.
+                Defaults to max_concurrency from the content generator config.
+
+        Returns:
+            List[str]: Generated conversation content, in the same order as inputs
+
+        Raises:
+            ValueError: If strategy validation fails
+            Exception: If there's an error in generating content.
+        """
+        if max_concurrency is None:
+            max_concurrency = self.content_generator_config.get("max_concurrency", 8)
+        try:
+            strategy = self.strategies[False]
+            groups: Dict[int, List[int]] = {}
+            for i, item in enumerate(inputs):
+                image_file_paths = item.get("image_file_paths", [])
+                strategy.validate(item.get("input_texts", ""), image_file_paths)
+                num_images = self.__num_prompt_images(image_file_paths)
+                groups.setdefault(num_images, []).append(i)
+
+            responses: List[str] = [""] * len(inputs)
+            for num_images, group in groups.items():
+                image_path_keys = self.__prepare_chain(num_images, longform=False)
+                prompt_params = [
+                    strategy.compose_prompt_params(
+                        self.config_conversation,
+                        inputs[i].get("image_file_paths", []),
+                        image_path_keys,
+                        inputs[i].get("input_texts", "")
+                    )
+                    for i in group
+                ]
+                outputs = self.chain.batch(
+                    prompt_params, config={"max_concurrency": max_concurrency}
+                )
+                for i, output in zip(group, outputs):
+                    responses[i] = strategy.clean(output, self.content_generator_config)
+
+            logger.info("Content generated successfully for %d inputs", len(inputs))
+            return responses
+
+        except Exception as e:
+            logger.error("Error generating batch content: %s", e)
             raise
+
+    async def agenerate_qa_content_batch(
+        self,
+        inputs: List[Dict[str, Any]],
+        max_concurrency: Optional[int] = None
+    ) -> List[str]:
+        """
+        Asynchronously generate Q&A content for several independent inputs.
+
+        Inputs are generated concurrently with agenerate_qa_content, with at most
+        max_concurrency generations in flight to stay within provider rate limits.
+
+        Args:
+            inputs (List[Dict[str, Any]]): One dict per podcast with optional
+                "input_texts", "image_file_paths" and "longform" keys.
+            max_concurrency (Optional[int]): Maximum number of concurrent generations.
+                Defaults to max_concurrency from the content generator config.
+
+        Returns:
+            List[str]: Generated conversation content, in the same order as inputs
+
+        Raises:
+            ValueError: If strategy validation fails
+            Exception: If there's an error in generating content.
+        """
+        if max_concurrency is None:
+            max_concurrency = self.content_generator_config.get("max_concurrency", 8)
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def generate(item: Dict[str, Any]) -> str:
+            async with semaphore:
+                return await self.agenerate_qa_content(
+                    item.get("input_texts", ""),
+                    item.get("image_file_paths", []),
+                    longform=item.get("longform", False)
+                )
+
+        responses = await asyncio.gather(*(generate(item) for item in inputs))
+        logger.info("Content generated successfully for %d inputs", len(inputs))
+        return list(responses)
+
+    def stream_qa_content(
+        self,
+        input_texts: str = "",
+        image_file_paths: List[str] = [],
+        output_filepath: Optional[str] = None,
+        use_cache: Optional[bool] = None
+    ) -> Iterator[str]:
+        """
+        Stream Q&A content as the LLM generates it.
+
+        The transcript is cleaned incrementally and yielded in pieces, each as soon as
+        later output can no longer change it, and appended to output_filepath if given,
+        so downstream consumers start before generation ends. The pieces join to exactly
+        the transcript generate_qa_content returns for the same LLM output.
+        Long-form generation is not streamed as it needs the whole transcript to
+        merge speaker turns.
+
+        Args:
+            input_texts (str): Input texts to generate content from.
+            image_file_paths (List[str]): List of image file paths.
+            output_filepath (Optional[str]): Filepath to write the transcript to as it streams.
+            use_cache (Optional[bool]): Whether to reuse LLM responses previously generated from
+                identical prompts. Defaults to None, which caches only when creativity is 0.
+
+        Yields:
+            str: Consecutive pieces of the cleaned transcript
+
+        Raises:
+            Exception: If there's an error in generating content.
+        """
+        try:
+            strategy, prompt_params = self.__prepare_generation(
+                input_texts, image_file_paths, longform=False, use_cache=use_cache
+            )
+
+            cleaner = TranscriptStreamCleaner(strategy, self.content_generator_config)
+            file = open(output_filepath, "w") if output_filepath else None
+            try:
+                parts = []
+                for chunk in self.chain.stream(prompt_params):
+                    piece = cleaner.feed(chunk)
+                    if not piece:
+                        continue
+                    if file:
+                        self.__append_text(file, piece)
+                    parts.append(piece)
+                    yield piece
+
+                # The stream has ended, so the rest of the transcript is final
+                piece = cleaner.finish()
+                if piece:
+                    if file:
+                        self.__append_text(file, piece)
+                    parts.append(piece)
+                    yield piece
+            finally:
+                if file:
+                    file.close()
+
+            self.response = "".join(parts)
+            logger.info("Content streamed successfully")
+            if output_filepath:
+                logger.info("Response content saved to %s", output_filepath)
+
+        except Exception as e:
+            logger.error("Error streaming content: %s", e)
+            raise
+
+    async def astream_qa_content(
+        self,
+        input_texts: str = "",
+        image_file_paths: List[str] = [],
+        output_filepath: Optional[str] = None,
+        use_cache: Optional[bool] = None
+    ) -> AsyncIterator[str]:
+        """
+        Asynchronously stream Q&A content turn by turn as the LLM generates it.
+
+        The async counterpart of stream_qa_content: the transcript is cleaned
+        incrementally and yielded in pieces that join to exactly the transcript
+        generate_qa_content returns, and appended to output_filepath from a worker
+        thread so writes never block the event loop.
+
+        Args:
+            input_texts (str): Input texts to generate content from.
+            image_file_paths (List[str]): List of image file paths.
+            output_filepath (Optional[str]): Filepath to write the transcript to as it streams.
+            use_cache (Optional[bool]): Whether to reuse LLM responses previously generated from
+                identical prompts. Defaults to None, which caches only when creativity is 0.
+
+        Yields:
+            str: Consecutive pieces of the cleaned transcript
+
+        Raises:
+            Exception: If there's an error in generating content.
+        """
+        try:
+            strategy, prompt_params = self.__prepare_generation(
+                input_texts, image_file_paths, longform=False, use_cache=use_cache
+            )
+            # Other calls may rebuild self.chain while this one is awaiting
+            chain = self.chain
+
+            cleaner = TranscriptStreamCleaner(strategy, self.content_generator_config)
+            file = open(output_filepath, "w") if output_filepath else None
+            try:
+                parts = []
+                async for chunk in chain.astream(prompt_params):
+                    piece = cleaner.feed(chunk)
+                    if not piece:
+                        continue
+                    if file:
+                        await asyncio.to_thread(self.__append_text, file, piece)
+                    parts.append(piece)
+                    yield piece
+
+                # The stream has ended, so the rest of the transcript is final
+                piece = cleaner.finish()
+                if piece:
+                    if file:
+                        await asyncio.to_thread(self.__append_text, file, piece)
+                    parts.append(piece)
+                    yield piece
+            finally:
+                if file:
+                    file.close()
+
+            self.response = "".join(parts)
+            logger.info("Content streamed successfully")
+            if output_filepath:
+                logger.info("Response content saved to %s", output_filepath)
+
+        except Exception as e:
+            logger.error("Error streaming content: %s", e)
+            raise
+
+    @staticmethod
+    def __append_text(file, text: str) -> None:
+        file.write(text)
+        file.flush()
@@ -6,27 +6,61 @@ websites, YouTube videos, and PDF files. It serves as a central hub for content
 extraction, delegating to specialized extractors based on the source type.
 """
 
+import asyncio
+import functools
 import logging
+import os
 import re
-from typing import List, Union
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
 from urllib.parse import urlparse
-from .youtube_transcriber import YouTubeTranscriber
-from .website_extractor import WebsiteExtractor
-from .pdf_extractor import PDFExtractor
 from podcastfy.utils.config import load_config
+from podcastfy.utils.cache import MemoryCache, ResponseCache
 
 logger = logging.getLogger(__name__)
 
+MAX_LOCAL_CACHE_ENTRIES = 128
+
+# Upper bound on concurrent source extractions to stay within remote rate limits
+MAX_EXTRACTION_WORKERS = 16
+
+# Shared by all extractors, as process_content creates a new ContentExtractor per call
+LOCAL_CONTENT_CACHE = MemoryCache(max_entries=MAX_LOCAL_CACHE_ENTRIES)
+
 class ContentExtractor:
 	def __init__(self):
 		"""
 		Initialize the ContentExtractor.
 		"""
-		self.youtube_transcriber = YouTubeTranscriber()
-		self.website_extractor = WebsiteExtractor()
-		self.pdf_extractor = PDFExtractor()
 		self.config = load_config()
 		self.content_extractor_config = self.config.get('content_extractor', {})
+		self.cache = ResponseCache(self.content_extractor_config.get('cache_dir', 'data/cache/extractor'))
+		self.cache_ttl = self.content_extractor_config.get('cache_ttl_hours', 0) * 3600
+		# PyMuPDF is not thread-safe, so concurrent extractions parse PDFs one at a time
+		self.pdf_lock = threading.Lock()
+		# Matched with a single regex scan rather than one substring search per pattern
+		youtube_url_patterns = self.content_extractor_config.get('youtube_url_patterns', [])
+		self.youtube_url_pattern = re.compile(
+			"|".join(re.escape(pattern) for pattern in youtube_url_patterns)
+		) if youtube_url_patterns else None
+
+	# Extractors are created on first use, as each imports its own heavy dependencies
+	# (youtube_transcript_api, BeautifulSoup, PyMuPDF) and most runs only need one
+	@functools.cached_property
+	def youtube_transcriber(self):
+		from .youtube_transcriber import YouTubeTranscriber
+		return YouTubeTranscriber()
+
+	@functools.cached_property
+	def website_extractor(self):
+		from .website_extractor import WebsiteExtractor
+		return WebsiteExtractor()
+
+	@functools.cached_property
+	def pdf_extractor(self):
+		from .pdf_extractor import PDFExtractor
+		return PDFExtractor()
 
 	def is_url(self, source: str) -> bool:
 		"""
@@ -48,10 +82,43 @@ class ContentExtractor:
 		except ValueError:
 			return False
 
-	def extract_content(self, source: str) -> str:
+	def extract_content(self, source: str, use_cache: bool = True) -> str:
 		"""
 		Extract content from various sources.
 
+		Args:
+			source (str): URL or file path of the content source.
+			use_cache (bool): Whether to reuse content cached within cache_ttl_hours. Defaults to True.
+
+		Returns:
+			str: Extracted text content.
+
+		Raises:
+			ValueError: If the source type is unsupported.
+		"""
+		if os.path.exists(source):
+			return self._extract_local_content(source)
+
+		# Remote sources rarely change between runs, so their content is cached on disk
+		if self.cache_ttl <= 0:
+			return self._extract_content(source)
+
+		key = ResponseCache.make_key(source)
+		cached = self.cache.get(key, max_age=self.cache_ttl) if use_cache else None
+		if cached is not None:
+			logger.info(f"Loaded cached content for {source}")
+			return cached.decode('utf-8')
+
+		content = self._extract_content(source)
+		self.cache.set(key, content.encode('utf-8'))
+		return content
+
+	async def aextract_content(self, source: str) -> str:
+		"""
+		Extract content from a source without blocking the event loop.
+
+		The underlying extractors are synchronous, so extraction runs in a worker thread.
+
 		Args:
 			source (str): URL or file path of the content source.
 
@@ -61,11 +128,83 @@ class ContentExtractor:
 		Raises:
 			ValueError: If the source type is unsupported.
 		"""
+		if source.lower().endswith('.pdf'):
+			return await asyncio.to_thread(self._extract_pdf_content, source)
+		return await asyncio.to_thread(self.extract_content, source)
+
+	def extract_contents(self, sources: List[str], max_workers: int = MAX_EXTRACTION_WORKERS) -> List[str]:
+		"""
+		Extract content from several sources concurrently, preserving their order.
+
+		Extraction is I/O bound, so sources are fetched on a thread pool. PDFs are
+		parsed on the calling thread as PyMuPDF is not thread-safe.
+
+		Args:
+			sources (List[str]): URLs or file paths of the content sources.
+			max_workers (int): Maximum number of sources extracted at once. Defaults to 16.
+
+		Returns:
+			List[str]: Extracted text content, in the same order as sources.
+		"""
+		if not sources:
+			return []
+
+		with ThreadPoolExecutor(max_workers=min(max_workers, len(sources))) as executor:
+			futures = [
+				None if source.lower().endswith('.pdf')
+				else executor.submit(self.extract_content, source)
+				for source in sources
+			]
+			return [
+				future.result() if future else self._extract_pdf_content(source)
+				for source, future in zip(sources, futures)
+			]
+
+	async def aextract_contents(self, sources: List[str], max_concurrency: int = MAX_EXTRACTION_WORKERS) -> List[str]:
+		"""
+		Extract content from several sources concurrently without blocking the event loop.
+
+		Runs extract_contents in a worker thread, which fetches the sources on its own
+		thread pool while the event loop only awaits the result.
+
+		Args:
+			sources (List[str]): URLs or file paths of the content sources.
+			max_concurrency (int): Size of the extract_contents thread pool, i.e. the maximum
+				number of sources fetched at once. PDFs are still parsed one at a time.
+				Defaults to 16.
+
+		Returns:
+			List[str]: Extracted text content, in the same order as sources.
+		"""
+		return await asyncio.to_thread(self.extract_contents, sources, max_concurrency)
+
+	def _extract_pdf_content(self, source: str) -> str:
+		with self.pdf_lock:
+			return self.extract_content(source)
+
+	def _extract_local_content(self, source: str) -> str:
+		"""
+		Extract content from a local file, reusing the result while the file is unchanged.
+		"""
+		stat = os.stat(source)
+		key = ResponseCache.make_key(os.path.abspath(source), stat.st_mtime_ns, stat.st_size)
+		cached = LOCAL_CONTENT_CACHE.get(key)
+		if cached is not None:
+			return cached.decode('utf-8')
+
+		content = self._extract_content(source)
+		LOCAL_CONTENT_CACHE.set(key, content.encode('utf-8'))
+		return content
+
+	def _extract_content(self, source: str) -> str:
+		"""
+		Extract content from a source, dispatching on its type.
+		"""
 		try:
 			if source.lower().endswith('.pdf'):
 				return self.pdf_extractor.extract_content(source)
 			elif self.is_url(source):
-				if any(pattern in source for pattern in self.content_extractor_config['youtube_url_patterns']):
+				if self.youtube_url_pattern and self.youtube_url_pattern.search(source):
 					return self.youtube_transcriber.extract_transcript(source)
 				else:
 					return self.website_extractor.extract_content(source)
@@ -6,6 +6,8 @@ BeautifulSoup for local HTML parsing instead of the Jina AI API.
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import re
 import html
 import logging
@@ -14,8 +16,17 @@ from bs4 import BeautifulSoup
 from podcastfy.utils.config import load_config
 from typing import List
 
+try:
+	import lxml  # noqa: F401
+	# C-backed parser, several times faster than the pure Python one on large pages
+	HTML_PARSER = 'lxml'
+except ImportError:
+	HTML_PARSER = 'html.parser'
+
 logger = logging.getLogger(__name__)
 
+WHITESPACE_PATTERN = re.compile(r'\s+')
+
 class WebsiteExtractor:
 	def __init__(self):
 		"""
@@ -27,6 +38,19 @@ class WebsiteExtractor:
 		self.user_agent = self.website_extractor_config.get('user_agent', 'Mozilla/5.0')
 		self.timeout = self.website_extractor_config.get('timeout', 10)
 		self.remove_patterns = self.website_extractor_config.get('markdown_cleaning', {}).get('remove_patterns', [])
+		# Compiled once here rather than looked up in the re module cache for every page
+		self._remove_patterns = [re.compile(pattern) for pattern in self.remove_patterns]
+
+		# Reuse connections (and TLS sessions) across pages instead of reconnecting per request
+		self.session = requests.Session()
+		self.session.headers.update({'User-Agent': self.user_agent})
+		# Transient connection errors are retried on the pooled connection with backoff
+		adapter = HTTPAdapter(
+			pool_maxsize=self.website_extractor_config.get('max_connections', 16),
+			max_retries=Retry(total=self.website_extractor_config.get('max_retries', 3), backoff_factor=0.3)
+		)
+		self.session.mount('http://', adapter)
+		self.session.mount('https://', adapter)
 
 	def extract_content(self, url: str) -> str:
 		"""
@@ -46,12 +70,11 @@ class WebsiteExtractor:
 			normalized_url = self.normalize_url(url)
 
 			# Request the webpage
-			headers = {'User-Agent': self.user_agent}
-			response = requests.get(normalized_url, headers=headers, timeout=self.timeout)
+			response = self.session.get(normalized_url, timeout=self.timeout)
 			response.raise_for_status()  # Raise an exception for bad status codes
 
 			# Parse the page content with BeautifulSoup
-			soup = BeautifulSoup(response.text, 'html.parser')
+			soup = BeautifulSoup(response.text, HTML_PARSER)
 
 			# Remove unwanted elements
 			self.remove_unwanted_elements(soup)
@@ -119,15 +142,12 @@ class WebsiteExtractor:
 		# Decode HTML entities
 		cleaned_content = html.unescape(content)
 
-		# Remove extra whitespace
-		cleaned_content = re.sub(r'\s+', ' ', cleaned_content)
-
-		# Remove extra newlines
-		cleaned_content = re.sub(r'\n{3,}', '\n\n', cleaned_content)
+		# Collapse all whitespace, newlines included, to single spaces
+		cleaned_content = WHITESPACE_PATTERN.sub(' ', cleaned_content)
 
 		# Apply custom cleaning patterns from config
-		for pattern in self.remove_patterns:
-			cleaned_content = re.sub(pattern, '', cleaned_content)
+		for pattern in self._remove_patterns:
+			cleaned_content = pattern.sub('', cleaned_content)
 
 		return cleaned_content.strip()
 
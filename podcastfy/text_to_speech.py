@@ -11,10 +11,12 @@ import logging
 import os
 import re
 import tempfile
-from typing import List, Tuple, Optional, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, List, Tuple, Optional, Dict, Any
 from pydub import AudioSegment
 
 from .tts.factory import TTSProviderFactory
+from .utils.cache import ResponseCache
 from .utils.config import load_config
 from .utils.config_conversation import load_conversation_config
 
@@ -54,6 +56,9 @@ class TextToSpeech:
         self._setup_directories()
         self.audio_format = self.tts_config.get("audio_format", "mp3")
         self.ending_message = self.tts_config.get("ending_message", "")
+        self.max_concurrency = max(1, self.tts_config.get("max_concurrency", 1))
+        audio_cache_dir = self.tts_config.get("audio_cache_dir")
+        self.audio_cache = ResponseCache(audio_cache_dir) if audio_cache_dir else None
 
     def _get_provider_config(self) -> Dict[str, Any]:
         """Get provider-specific configuration."""
@@ -76,6 +81,25 @@ class TextToSpeech:
         logger.debug(f"Using provider config: {provider_config}")
         return provider_config
 
+    def _synthesize(self, text: str, voice: str, model: str) -> bytes:
+        """
+        Generate audio for a single speech segment, reusing previously synthesized audio.
+
+        Segments are cached by provider, voice, model and text, so unchanged lines are
+        not sent to the TTS provider again.
+        """
+        if not self.audio_cache:
+            return self.provider.generate_audio(text, voice, model)
+
+        key = ResponseCache.make_key(
+            self.provider.__class__.__name__, voice, model, self.audio_format, text
+        )
+        audio_data = self.audio_cache.get(key)
+        if audio_data is None:
+            audio_data = self.provider.generate_audio(text, voice, model)
+            self.audio_cache.set(key, audio_data)
+        return audio_data
+
     def convert_to_speech(self, text: str, output_file: str) -> None:
         """
         Convert input text to speech and save as an audio file.
@@ -152,28 +176,104 @@ class TextToSpeech:
             logger.error(f"Error converting text to speech: {str(e)}")
             raise
 
+    def convert_to_speech_stream(self, turns: Iterable[str], output_file: str) -> str:
+        """
+        Convert a streamed transcript to speech as it arrives and save as an audio file.
+
+        Q&A pairs are synthesized in the background as soon as they are complete, so
+        speech synthesis overlaps with the generation of later turns. Up to max_concurrency
+        segments are synthesized at once. The pieces are joined as they are and split with
+        the provider's split_qa, so the segments match those convert_to_speech gives for
+        the joined transcript. Multi-speaker providers synthesize the whole conversation
+        at once, so the stream is collected before conversion.
+
+        Args:
+                turns (Iterable[str]): Consecutive pieces of the transcript, such as those
+                    yielded by ContentGenerator.stream_qa_content.
+                output_file (str): Path to save the output audio file.
+
+        Returns:
+                str: The full transcript received from the stream.
+
+        Raises:
+            ValueError: If the stream contains no dialogue
+        """
+        if "multi" in self.provider.model.lower():
+            text = "".join(turns)
+            self.convert_to_speech(text, output_file)
+            return text
+
+        try:
+            provider_config = self._get_provider_config()
+            voices = provider_config.get("default_voices", {})
+            model = provider_config.get("model")
+
+            parts = []
+            futures = []
+            queued = 0
+            with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+
+                def submit(qa_pairs: List[Tuple[str, str]]) -> None:
+                    for question, answer in qa_pairs:
+                        futures.append(executor.submit(self._synthesize, question, voices.get("question"), model))
+                        futures.append(executor.submit(self._synthesize, answer, voices.get("answer"), model))
+
+                for chunk in turns:
+                    parts.append(chunk)
+                    qa_pairs = self.provider.split_qa(
+                        "".join(parts), self.ending_message, self.provider.get_supported_tags()
+                    )
+                    # The last pair is held back, as its answer may still be the ending message
+                    submit(qa_pairs[queued:-1])
+                    queued = max(queued, len(qa_pairs) - 1)
+
+                text = "".join(parts)
+                qa_pairs = self.provider.split_qa(
+                    text, self.ending_message, self.provider.get_supported_tags()
+                )
+                if not qa_pairs:
+                    raise ValueError("No dialogue found in the streamed transcript")
+                submit(qa_pairs[queued:])
+
+                combined = AudioSegment.empty()
+                for future in futures:
+                    combined += AudioSegment.from_file(io.BytesIO(future.result()), format=self.audio_format)
+
+            os.makedirs(os.path.dirname(output_file), exist_ok=True)
+            combined.export(output_file, format=self.audio_format)
+            logger.info(f"Audio saved to {output_file}")
+            return text
+
+        except Exception as e:
+            logger.error(f"Error converting streamed text to speech: {str(e)}")
+            raise
+
     def _generate_audio_segments(self, text: str, temp_dir: str) -> List[str]:
         """Generate audio segments for each Q&A pair."""
         qa_pairs = self.provider.split_qa(
             text, self.ending_message, self.provider.get_supported_tags()
         )
-        audio_files = []
         provider_config = self._get_provider_config()
+        model = provider_config.get("model")
+
+        def generate_segment(temp_file: str, content: str, voice: str) -> str:
+            audio_data = self._synthesize(content, voice, model)
+            with open(temp_file, "wb") as f:
+                f.write(audio_data)
+            return temp_file
+
+        # Segments are independent, so they are synthesized concurrently up to max_concurrency
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+            futures = []
+            for idx, (question, answer) in enumerate(qa_pairs, 1):
+                for speaker_type, content in [("question", question), ("answer", answer)]:
+                    temp_file = os.path.join(
+                        temp_dir, f"{idx}_{speaker_type}.{self.audio_format}"
+                    )
+                    voice = provider_config.get("default_voices", {}).get(speaker_type)
+                    futures.append(executor.submit(generate_segment, temp_file, content, voice))
 
-        for idx, (question, answer) in enumerate(qa_pairs, 1):
-            for speaker_type, content in [("question", question), ("answer", answer)]:
-                temp_file = os.path.join(
-                    temp_dir, f"{idx}_{speaker_type}.{self.audio_format}"
-                )
-                voice = provider_config.get("default_voices", {}).get(speaker_type)
-                model = provider_config.get("model")
-
-                audio_data = self.provider.generate_audio(content, voice, model)
-                with open(temp_file, "wb") as f:
-                    f.write(audio_data)
-                audio_files.append(temp_file)
-
-        return audio_files
+            return [future.result() for future in futures]
 
     def _merge_audio_files(self, audio_files: List[str], output_file: str) -> None:
         """
@@ -228,16 +328,14 @@ class TextToSpeech:
         base_dir = os.path.abspath(os.path.dirname(__file__))
         self.temp_audio_dir = os.path.join(base_dir, self.temp_audio_dir)
 
-        os.makedirs(self.temp_audio_dir, exist_ok=True)
-
         # Create directories if they don't exist
         for dir_path in [
             self.output_directories.get("transcripts"),
             self.output_directories.get("audio"),
             self.temp_audio_dir,
         ]:
-            if dir_path and not os.path.exists(dir_path):
-                os.makedirs(dir_path)
+            if dir_path:
+                os.makedirs(dir_path, exist_ok=True)
 
     def _validate_transcript_format(self, text: str) -> None:
         """
@@ -1,27 +1,32 @@
 """Factory for creating TTS providers."""
 
-from typing import Dict, Type, Optional
+import importlib
+from typing import Dict, Type, Optional, Tuple, Union
 from .base import TTSProvider
-from .providers.elevenlabs import ElevenLabsTTS
-from .providers.openai import OpenAITTS
-from .providers.edge import EdgeTTS
-from .providers.gemini import GeminiTTS
-from .providers.geminimulti import GeminiMultiTTS
+
 class TTSProviderFactory:
     """Factory class for creating TTS providers."""
     
-    _providers: Dict[str, Type[TTSProvider]] = {
-        'elevenlabs': ElevenLabsTTS,
-        'openai': OpenAITTS,
-        'edge': EdgeTTS,
-        'gemini': GeminiTTS,
-        'geminimulti': GeminiMultiTTS
+    # Built-in providers are referenced as "module:Class" and imported on first use,
+    # so only the SDK of the selected provider is loaded
+    _providers: Dict[str, Union[str, Type[TTSProvider]]] = {
+        'elevenlabs': '.providers.elevenlabs:ElevenLabsTTS',
+        'openai': '.providers.openai:OpenAITTS',
+        'edge': '.providers.edge:EdgeTTS',
+        'gemini': '.providers.gemini:GeminiTTS',
+        'geminimulti': '.providers.geminimulti:GeminiMultiTTS'
     }
+
+    # Provider instances keyed by (provider_name, api_key, model), reused across calls
+    _instances: Dict[Tuple[str, Optional[str], Optional[str]], TTSProvider] = {}
     
     @classmethod
     def create(cls, provider_name: str, api_key: Optional[str] = None, model: Optional[str] = None) -> TTSProvider:
         """
         Create a TTS provider instance.
+
+        Instances are cached per (provider_name, api_key, model) so SDK clients and
+        their HTTP connection pools are reused across podcasts.
         
         Args:
             provider_name: Name of the provider to create
@@ -38,10 +43,24 @@ class TTSProviderFactory:
         if not provider_class:
             raise ValueError(f"Unsupported provider: {provider_name}. "
                            f"Choose from: {', '.join(cls._providers.keys())}")
-                           
-        return provider_class(api_key, model) if api_key else provider_class(model=model)
+
+        key = (provider_name.lower(), api_key, model)
+        provider = cls._instances.get(key)
+        if provider is None:
+            if isinstance(provider_class, str):
+                module_name, class_name = provider_class.split(':')
+                provider_class = getattr(importlib.import_module(module_name, __package__), class_name)
+                cls._providers[provider_name.lower()] = provider_class
+            provider = provider_class(api_key, model) if api_key else provider_class(model=model)
+            cls._instances[key] = provider
+        return provider
     
     @classmethod
     def register_provider(cls, name: str, provider_class: Type[TTSProvider]) -> None:
         """Register a new provider class."""
-        cls._providers[name.lower()] = provider_class 
\ No newline at end of file
+        cls._providers[name.lower()] = provider_class
+        # Drop cached instances of a provider being replaced
+        cls._instances = {
+            key: provider for key, provider in cls._instances.items()
+            if key[0] != name.lower()
+        }
@@ -22,9 +22,6 @@ class EdgeTTS(TTSProvider):
         import nest_asyncio
         import asyncio
         
-        # Apply nest_asyncio to allow nested event loops
-        nest_asyncio.apply()
-        
         async def _generate():
             communicate = edge_tts.Communicate(text, voice)
             # Create a temporary file with proper context management
@@ -42,8 +39,14 @@ class EdgeTTS(TTSProvider):
                 if os.path.exists(temp_path):
                     os.remove(temp_path)
 
-        # Use nest_asyncio to handle nested event loops
-        loop = asyncio.get_event_loop()
+        try:
+            loop = asyncio.get_event_loop()
+        except RuntimeError:
+            # Worker threads have no event loop of their own; asyncio.run closes the one it creates
+            return asyncio.run(_generate())
+
+        # Apply nest_asyncio to allow nested event loops
+        nest_asyncio.apply(loop)
         return loop.run_until_complete(_generate())
         
     def get_supported_tags(self) -> List[str]:
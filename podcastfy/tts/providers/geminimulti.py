@@ -3,6 +3,7 @@
 from google.cloud import texttospeech_v1beta1
 from typing import List
 from ..base import TTSProvider
+import os
 import re
 import logging
 from io import BytesIO
@@ -176,7 +177,6 @@ class GeminiMultiTTS(TTSProvider):
                         logger.error(f"Error processing chunk {i}: {str(e)}")
                     
                     # Clean up temp file
-                    import os
                     try:
                         os.remove(temp_file)
                     except Exception as e:
@@ -0,0 +1,226 @@
+"""
+Cache Module
+
+This module provides small content-addressed caches for expensive results, such as
+LLM responses: a disk cache and a SQLite cache persisted across runs of the Podcastfy
+application, and an in-memory cache with the same interface.
+"""
+
+import hashlib
+import logging
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+import orjson
+
+logger = logging.getLogger(__name__)
+
+
+def hash_file(file_path: str) -> str:
+	"""
+	Compute the BLAKE2b digest of a local file's contents.
+
+	Args:
+		file_path (str): Path to the file.
+
+	Returns:
+		str: Hex digest of the file contents.
+	"""
+	with open(file_path, 'rb') as file:
+		return hashlib.file_digest(file, 'blake2b').hexdigest()
+
+
+class ResponseCache:
+	def __init__(self, cache_dir: str):
+		"""
+		Initialize the ResponseCache.
+
+		Args:
+			cache_dir (str): Directory where cached entries are stored.
+		"""
+		self.cache_dir = cache_dir
+
+	@staticmethod
+	def make_key(*parts: Any) -> str:
+		"""
+		Build a stable cache key from JSON-serializable parts.
+
+		Args:
+			*parts (Any): Values that fully determine the cached result.
+
+		Returns:
+			str: Hex digest identifying the entry.
+		"""
+		payload = orjson.dumps(
+			parts, default=str, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+		)
+		return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+	def _path(self, key: str) -> str:
+		return os.path.join(self.cache_dir, key[:2], key)
+
+	def get(self, key: str, max_age: Optional[float] = None) -> Optional[bytes]:
+		"""
+		Get a cached value by key.
+
+		Args:
+			key (str): The cache key.
+			max_age (Optional[float]): Maximum age of the entry in seconds. Older entries
+				are treated as a miss. Defaults to None (entries never expire).
+
+		Returns:
+			Optional[bytes]: The cached value, or None on a miss.
+		"""
+		path = self._path(key)
+		try:
+			if max_age is not None and time.time() - os.path.getmtime(path) > max_age:
+				return None
+			with open(path, 'rb') as file:
+				return file.read()
+		except FileNotFoundError:
+			return None
+		except OSError as e:
+			logger.warning(f"Error reading cache entry {key}: {str(e)}")
+			return None
+
+	def set(self, key: str, value: bytes) -> None:
+		"""
+		Store a value under the given key.
+
+		The entry is written to a temporary file and renamed into place so concurrent
+		readers never observe a partially written value.
+
+		Args:
+			key (str): The cache key.
+			value (bytes): The value to store.
+		"""
+		path = self._path(key)
+		try:
+			os.makedirs(os.path.dirname(path), exist_ok=True)
+			fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path))
+			with os.fdopen(fd, 'wb') as file:
+				file.write(value)
+			os.replace(temp_path, path)
+		except OSError as e:
+			logger.warning(f"Error writing cache entry {key}: {str(e)}")
+
+
+class MemoryCache:
+	def __init__(self, max_entries: Optional[int] = None):
+		"""
+		Initialize the MemoryCache, which keeps entries for the lifetime of the process.
+
+		Args:
+			max_entries (Optional[int]): Maximum number of entries kept, evicting the least
+				recently used first. Defaults to None (unbounded).
+		"""
+		self.entries: Dict[str, Tuple[float, bytes]] = {}
+		self.max_entries = max_entries
+		self._lock = threading.Lock()
+
+	def get(self, key: str, max_age: Optional[float] = None) -> Optional[bytes]:
+		"""
+		Get a cached value by key.
+
+		Args:
+			key (str): The cache key.
+			max_age (Optional[float]): Maximum age of the entry in seconds. Defaults to None.
+
+		Returns:
+			Optional[bytes]: The cached value, or None on a miss.
+		"""
+		with self._lock:
+			entry = self.entries.get(key)
+			if entry is None or (max_age is not None and time.time() - entry[0] > max_age):
+				return None
+			if self.max_entries is not None:
+				# Dicts keep insertion order, so re-inserting marks the entry as most recent
+				self.entries[key] = self.entries.pop(key)
+			return entry[1]
+
+	def set(self, key: str, value: bytes) -> None:
+		"""
+		Store a value under the given key.
+
+		Args:
+			key (str): The cache key.
+			value (bytes): The value to store.
+		"""
+		with self._lock:
+			self.entries.pop(key, None)
+			self.entries[key] = (time.time(), value)
+			if self.max_entries is not None and len(self.entries) > self.max_entries:
+				del self.entries[next(iter(self.entries))]
+
+
+class SQLiteCache:
+	def __init__(self, database_path: str):
+		"""
+		Initialize the SQLiteCache, which keeps all entries in a single database file.
+
+		Args:
+			database_path (str): Path to the SQLite database. It is created on first use.
+		"""
+		self.database_path = database_path
+		self._connection: Optional[sqlite3.Connection] = None
+		self._lock = threading.Lock()
+
+	def _connect(self) -> sqlite3.Connection:
+		if self._connection is None:
+			directory = os.path.dirname(self.database_path)
+			if directory:
+				os.makedirs(directory, exist_ok=True)
+			connection = sqlite3.connect(self.database_path, check_same_thread=False)
+			# WAL lets several Podcastfy processes read while one of them writes
+			connection.execute("PRAGMA journal_mode=WAL")
+			connection.execute(
+				"CREATE TABLE IF NOT EXISTS entries (key TEXT PRIMARY KEY, created REAL, value BLOB)"
+			)
+			self._connection = connection
+		return self._connection
+
+	def get(self, key: str, max_age: Optional[float] = None) -> Optional[bytes]:
+		"""
+		Get a cached value by key.
+
+		Args:
+			key (str): The cache key.
+			max_age (Optional[float]): Maximum age of the entry in seconds. Defaults to None.
+
+		Returns:
+			Optional[bytes]: The cached value, or None on a miss.
+		"""
+		try:
+			with self._lock:
+				row = self._connect().execute(
+					"SELECT created, value FROM entries WHERE key = ?", (key,)
+				).fetchone()
+		except (OSError, sqlite3.Error) as e:
+			logger.warning(f"Error reading cache entry {key}: {str(e)}")
+			return None
+		if row is None or (max_age is not None and time.time() - row[0] > max_age):
+			return None
+		return row[1]
+
+	def set(self, key: str, value: bytes) -> None:
+		"""
+		Store a value under the given key.
+
+		Args:
+			key (str): The cache key.
+			value (bytes): The value to store.
+		"""
+		try:
+			with self._lock:
+				connection = self._connect()
+				with connection:
+					connection.execute(
+						"INSERT OR REPLACE INTO entries (key, created, value) VALUES (?, ?, ?)",
+						(key, time.time(), value)
+					)
+		except (OSError, sqlite3.Error) as e:
+			logger.warning(f"Error writing cache entry {key}: {str(e)}")
@@ -6,11 +6,14 @@ It uses environment variables to securely store and access API keys and other se
 and a YAML file for non-sensitive configuration settings.
 """
 
+import copy
+import functools
 import os
 from dotenv import load_dotenv, find_dotenv
 from typing import Any, Dict, Optional
 import yaml
 
+@functools.lru_cache(maxsize=8)
 def get_config_path(config_file: str = 'config.yaml'):
 	"""
 	Get the path to the config.yaml file.
@@ -37,6 +40,25 @@ def get_config_path(config_file: str = 'config.yaml'):
 		print(f"Error locating {config_file}: {str(e)}")
 		return None
 
+@functools.lru_cache(maxsize=8)
+def _read_config_file(config_path: str) -> Dict[str, Any]:
+	"""
+	Read and parse a YAML configuration file once per process.
+	"""
+	with open(config_path, 'r') as file:
+		return yaml.safe_load(file)
+
+@functools.lru_cache(maxsize=1)
+def _load_env() -> None:
+	"""
+	Load environment variables from the .env file once per process.
+	"""
+	dotenv_path = find_dotenv(usecwd=True)
+	if dotenv_path:
+		load_dotenv(dotenv_path)
+	else:
+		print("Warning: .env file not found. Using environment variables if available.")
+
 class Config:
 	def __init__(self, config_file: str = 'config.yaml'):
 		"""
@@ -46,11 +68,7 @@ class Config:
 			config_file (str): Path to the YAML configuration file. Defaults to 'config.yaml'.
 		"""
 		# Try to find .env file
-		dotenv_path = find_dotenv(usecwd=True)
-		if dotenv_path:
-			load_dotenv(dotenv_path)
-		else:
-			print("Warning: .env file not found. Using environment variables if available.")
+		_load_env()
 		
 		# Load API keys from environment variables
 		self.GEMINI_API_KEY: str = os.getenv("GEMINI_API_KEY", "")
@@ -59,8 +77,8 @@ class Config:
 		
 		config_path = get_config_path(config_file)
 		if config_path:
-			with open(config_path, 'r') as file:
-				self.config: Dict[str, Any] = yaml.safe_load(file)
+			# Copy the cached settings as configure() mutates them per instance
+			self.config: Dict[str, Any] = copy.deepcopy(_read_config_file(config_path))
 		else:
 			print("Could not locate config.yaml")
 			self.config = {}
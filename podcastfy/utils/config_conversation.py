@@ -5,11 +5,14 @@ This module handles the loading and management of conversation configuration set
 for the Podcastfy application. It uses a YAML file for conversation-specific configuration settings.
 """
 
+import copy
+import functools
 import os
 import sys
 from typing import Any, Dict, Optional, List
 import yaml
 
+@functools.lru_cache(maxsize=8)
 def get_conversation_config_path(config_file: str = 'conversation_config.yaml'):
 	"""
 	Get the path to the conversation_config.yaml file.
@@ -45,6 +48,14 @@ def get_conversation_config_path(config_file: str = 'conversation_config.yaml'):
 		print(f"Error locating {config_file}: {str(e)}")
 		return None
 
+@functools.lru_cache(maxsize=8)
+def _read_config_file(config_path: str) -> Dict[str, Any]:
+	"""
+	Read and parse a YAML configuration file once per process.
+	"""
+	with open(config_path, 'r') as file:
+		return yaml.safe_load(file)
+
 class NestedConfig:
 	"""
 	A class to handle nested configuration objects with proper method inheritance.
@@ -140,11 +151,6 @@ class ConversationConfig(NestedConfig):
 		# Load default configuration
 		self.config_conversation = self._load_default_config()
 		if config_conversation is not None:
-			import copy
-			
-			# Create a deep copy of the default configuration
-			self.config_conversation = copy.deepcopy(self.config_conversation)
-			
 			# Update the configuration with provided values
 			if isinstance(config_conversation, dict):
 				self._deep_update(self.config_conversation, config_conversation)
@@ -158,8 +164,8 @@ class ConversationConfig(NestedConfig):
 		"""Load the default configuration from conversation_config.yaml."""
 		config_path = get_conversation_config_path()
 		if config_path:
-			with open(config_path, 'r') as file:
-				return yaml.safe_load(file)
+			# Copy the cached defaults so instances never share mutable values
+			return copy.deepcopy(_read_config_file(config_path))
 		else:
 			raise FileNotFoundError("conversation_config.yaml not found")
 
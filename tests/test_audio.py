@@ -1,10 +1,30 @@
+import io
 import unittest
 import pytest
 import os
+import tempfile
+from pydub import AudioSegment
+from podcastfy.content_generator import StandardContentStrategy, TranscriptStreamCleaner
 from podcastfy.text_to_speech import TextToSpeech
+from podcastfy.tts.base import TTSProvider
+from podcastfy.tts.factory import TTSProviderFactory
 from podcastfy.utils.config_conversation import load_conversation_config
 
 
+class FakeTTS(TTSProvider):
+    """Offline provider that records the text it is asked to synthesize."""
+
+    def __init__(self, api_key: str = None, model: str = None):
+        self.model = model or "fake"
+        self.calls = []
+
+    def generate_audio(self, text: str, voice: str, model: str, voice2: str = None) -> bytes:
+        self.calls.append((text, voice))
+        buffer = io.BytesIO()
+        AudioSegment.silent(duration=10).export(buffer, format="wav")
+        return buffer.getvalue()
+
+
 class TestAudio(unittest.TestCase):
     def setUp(self):
         self.test_text = "<Person1>Hello, how are you?</Person1><Person2>I'm doing great, thanks for asking!</Person2>"
@@ -71,5 +91,131 @@ class TestAudio(unittest.TestCase):
         os.remove(output_file)
 
 
+class TestAudioStream(unittest.TestCase):
+    def setUp(self):
+        TTSProviderFactory.register_provider("fake", FakeTTS)
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.conversation_config = {
+            "text_to_speech": {
+                "audio_format": "wav",
+                "ending_message": "Bye!",
+                "max_concurrency": 1,
+                "audio_cache_dir": "",
+                "output_directories": {
+                    "transcripts": os.path.join(self.temp_dir.name, "transcripts"),
+                    "audio": os.path.join(self.temp_dir.name, "audio"),
+                },
+            }
+        }
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _synthesized(self, turns, stream):
+        tts = TextToSpeech(model="fake", api_key="test", conversation_config=self.conversation_config)
+        tts.provider.calls.clear()
+        output_file = os.path.join(self.temp_dir.name, "audio", "podcast.wav")
+        if stream:
+            tts.convert_to_speech_stream(iter(turns), output_file)
+        else:
+            tts.convert_to_speech("".join(turns), output_file)
+        self.assertTrue(os.path.exists(output_file))
+        return list(tts.provider.calls)
+
+    def test_stream_matches_split_qa(self):
+        transcripts = [
+            ["<Person1>Hi there.</Person1>", "<Person2>Hello!</Person2>", "<Person1>Bye now.</Person1>"],
+            ["<Person2>I start.</Person2>", "<Person1>Then me.</Person1>", "<Person2>And me.</Person2>"],
+            ["<Person1>One <emphasis>two</emphasis></Person1>", "<Person1>three</Person1>",
+             "<Person2>four</Person2>"],
+            ["<Person1>Only question</Person1>"],
+        ]
+        for turns in transcripts:
+            with self.subTest(turns=turns):
+                self.assertEqual(self._synthesized(turns, stream=True), self._synthesized(turns, stream=False))
+
+    def test_stream_matches_cleaned_transcript(self):
+        # Pieces as stream_qa_content yields them synthesize like the whole cleaned transcript
+        strategy = StandardContentStrategy(None, {}, {})
+        transcript = (
+            "```scratchpad\nEnd on </Person2>\n```\n"
+            "<Person1>Hi [laughs] there.</Person1>\n<Person2>Hello *you </Person2>\n"
+            "<Person1>all*.</Person1>\n<Person2>Bye _now</Person2><Person1>then_.</Person1>"
+        )
+        cleaner = TranscriptStreamCleaner(strategy, {})
+        pieces = [cleaner.feed(transcript[i:i + 7]) for i in range(0, len(transcript), 7)]
+        pieces.append(cleaner.finish())
+
+        self.assertEqual(
+            self._synthesized(pieces, stream=True),
+            self._synthesized([strategy.clean(transcript, {})], stream=False),
+        )
+
+    def test_stream_without_dialogue_raises(self):
+        tts = TextToSpeech(model="fake", api_key="test", conversation_config=self.conversation_config)
+        output_file = os.path.join(self.temp_dir.name, "audio", "empty.wav")
+        with self.assertRaises(ValueError):
+            tts.convert_to_speech_stream(iter([]), output_file)
+        self.assertFalse(os.path.exists(output_file))
+
+
+class TestAudioCache(unittest.TestCase):
+    def setUp(self):
+        TTSProviderFactory.register_provider("fake", FakeTTS)
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.test_text = "<Person1>Hello, how are you?</Person1><Person2>I'm doing great!</Person2>"
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _make_tts(self, audio_cache_dir):
+        conversation_config = {
+            "text_to_speech": {
+                "audio_format": "wav",
+                "audio_cache_dir": audio_cache_dir,
+                "output_directories": {
+                    "transcripts": os.path.join(self.temp_dir.name, "transcripts"),
+                    "audio": os.path.join(self.temp_dir.name, "audio"),
+                },
+            }
+        }
+        tts = TextToSpeech(model="fake", api_key="test", conversation_config=conversation_config)
+        tts.provider.calls.clear()
+        return tts
+
+    def test_audio_cache_disabled_by_default(self):
+        tts = TextToSpeech(model="fake", api_key="test")
+        self.assertIsNone(tts.audio_cache)
+
+    def test_audio_cache_reuses_segments(self):
+        tts = self._make_tts(os.path.join(self.temp_dir.name, "tts_cache"))
+        output_file = os.path.join(self.temp_dir.name, "audio", "podcast.wav")
+
+        tts.convert_to_speech(self.test_text, output_file)
+        synthesized = len(tts.provider.calls)
+        tts.convert_to_speech(self.test_text, output_file)
+
+        self.assertGreater(synthesized, 0)
+        self.assertEqual(len(tts.provider.calls), synthesized)
+
+
+class TestTTSProviderFactory(unittest.TestCase):
+    def setUp(self):
+        TTSProviderFactory.register_provider("fake", FakeTTS)
+
+    def test_instances_reused_per_key_and_model(self):
+        provider = TTSProviderFactory.create("fake", api_key="key-1", model="fake")
+
+        self.assertIs(TTSProviderFactory.create("FAKE", api_key="key-1", model="fake"), provider)
+        self.assertIsNot(TTSProviderFactory.create("fake", api_key="key-2", model="fake"), provider)
+        self.assertIsNot(TTSProviderFactory.create("fake", api_key="key-1", model="other"), provider)
+
+    def test_register_provider_drops_cached_instances(self):
+        provider = TTSProviderFactory.create("fake", api_key="key-1", model="fake")
+        TTSProviderFactory.register_provider("fake", FakeTTS)
+
+        self.assertIsNot(TTSProviderFactory.create("fake", api_key="key-1", model="fake"), provider)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,95 @@
+import os
+import tempfile
+import threading
+import time
+import unittest
+
+from podcastfy.utils.cache import ResponseCache, SQLiteCache
+
+
+class TestResponseCache(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache = ResponseCache(os.path.join(self.temp_dir.name, "responses"))
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_make_key_is_stable(self):
+        self.assertEqual(
+            ResponseCache.make_key("model", 0, "prompt"),
+            ResponseCache.make_key("model", 0, "prompt"),
+        )
+        self.assertNotEqual(
+            ResponseCache.make_key("model", 0, "prompt"),
+            ResponseCache.make_key("model", 1, "prompt"),
+        )
+
+    def test_get_and_set(self):
+        key = ResponseCache.make_key("prompt")
+        self.assertIsNone(self.cache.get(key))
+
+        self.cache.set(key, b"response")
+        self.assertEqual(self.cache.get(key), b"response")
+        # Entries persist across instances sharing a directory
+        self.assertEqual(ResponseCache(self.cache.cache_dir).get(key), b"response")
+
+    def test_expired_entries_are_misses(self):
+        key = ResponseCache.make_key("prompt")
+        self.cache.set(key, b"response")
+        time.sleep(0.01)
+
+        self.assertIsNone(self.cache.get(key, max_age=0.001))
+        self.assertEqual(self.cache.get(key, max_age=60), b"response")
+
+
+class TestSQLiteCache(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.database_path = os.path.join(self.temp_dir.name, "cache", "responses.db")
+        self.cache = SQLiteCache(self.database_path)
+
+    def tearDown(self):
+        if self.cache._connection is not None:
+            self.cache._connection.close()
+        self.temp_dir.cleanup()
+
+    def test_database_created_on_first_use(self):
+        self.assertFalse(os.path.exists(self.database_path))
+        self.assertIsNone(self.cache.get("missing"))
+        self.assertTrue(os.path.exists(self.database_path))
+
+    def test_get_and_set(self):
+        self.cache.set("key", b"response")
+        self.cache.set("key", b"updated")
+
+        self.assertEqual(self.cache.get("key"), b"updated")
+        other = SQLiteCache(self.database_path)
+        self.assertEqual(other.get("key"), b"updated")
+        other._connection.close()
+
+    def test_expired_entries_are_misses(self):
+        self.cache.set("key", b"response")
+        time.sleep(0.01)
+
+        self.assertIsNone(self.cache.get("key", max_age=0.001))
+        self.assertEqual(self.cache.get("key", max_age=60), b"response")
+
+    def test_concurrent_writes(self):
+        def write(i):
+            self.cache.set(f"key-{i}", str(i).encode())
+
+        threads = [threading.Thread(target=write, args=(i,)) for i in range(16)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(
+            [self.cache.get(f"key-{i}") for i in range(16)],
+            [str(i).encode() for i in range(16)],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,359 @@
+import asyncio
+import os
+import random
+import re
+import tempfile
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+from langchain_core.prompts import ChatPromptTemplate
+from langchain_core.runnables import RunnableGenerator, RunnableLambda
+
+from podcastfy import content_generator
+from podcastfy.content_generator import (
+    CachedChain,
+    ContentCleanerMixin,
+    ContentGenerator,
+    StandardContentStrategy,
+    TranscriptStreamCleaner,
+)
+from podcastfy.utils.cache import MemoryCache, ResponseCache
+
+
+# Stands in for the LangChain Hub template so tests run offline
+FAKE_PROMPT = ChatPromptTemplate.from_messages(
+    [("system", "You are the host of {podcast_name}.")]
+)
+
+FIRST_TRANSCRIPT = "<Person1>Welcome to the show.</Person1>\n<Person2>Glad to be here.</Person2>"
+SECOND_TRANSCRIPT = "<Person1>Today we talk about caching.</Person1>\n<Person2>Sounds fun.</Person2>"
+
+# Fragments combined at random to exercise every transcript cleaning pattern
+MARKUP_TOKENS = [
+    "<Person1>", "<Person2>", "</Person1>", "</Person2>", "Hello", " there.", " ", "\n",
+    "\n\n", "\t", "_", "*", "[", "]", "[laughs]", "```scratchpad\n", "```plaintext\n", "```",
+    "xml", "<break time='1s'/>", "<emphasis>", "<", ">", "<p>", "</p>", "<speak>",
+]
+
+
+def echo_transcript(prompt_value):
+    """Fake model answering with the input text, so outputs do not depend on call order."""
+    input_text = prompt_value.to_messages()[-1].content[0]["text"].rsplit(". ", 1)[-1]
+    return f"<Person1>{input_text}</Person1><Person2>Interesting.</Person2>"
+
+
+class TestContentGenerator(unittest.TestCase):
+    def setUp(self):
+        prompt_patcher = patch("langchain.hub.pull", return_value=FAKE_PROMPT)
+        prompt_patcher.start()
+        self.addCleanup(prompt_patcher.stop)
+
+    def make_generator(self, responses, model_name="gemini-1.5-pro-latest"):
+        """Build a ContentGenerator whose LLM is a fake model or runnable."""
+        with patch(
+            "podcastfy.content_generator.LLMBackend",
+            return_value=SimpleNamespace(llm=None),
+        ):
+            generator = ContentGenerator(model_name=model_name, api_key_label="TEST_API_KEY")
+        generator.llm = FakeListChatModel(responses=responses) if isinstance(responses, list) else responses
+        generator.response_cache = None
+        return generator
+
+    def test_claude_prompt_has_cache_breakpoint(self):
+        generator = self.make_generator([], model_name="claude-3-5-sonnet-latest")
+        prompt, _ = generator._ContentGenerator__compose_prompt(0)
+        messages = prompt.format_messages(
+            podcast_name="Podcastfy", input_text="Some input"
+        )
+
+        self.assertEqual(
+            messages[0].content[-1]["cache_control"], {"type": "ephemeral"}
+        )
+        self.assertIn("You are the host of Podcastfy.", messages[0].content[-1]["text"])
+        self.assertEqual(
+            [block.get("cache_control") for block in messages[1].content], [None]
+        )
+
+    def test_other_models_have_no_cache_breakpoint(self):
+        generator = self.make_generator([])
+        prompt, _ = generator._ContentGenerator__compose_prompt(0)
+        messages = prompt.format_messages(
+            podcast_name="Podcastfy", input_text="Some input"
+        )
+
+        self.assertIsInstance(messages[0].content, str)
+
+    def test_generate_reuses_cached_response(self):
+        generator = self.make_generator([FIRST_TRANSCRIPT, SECOND_TRANSCRIPT])
+        with tempfile.TemporaryDirectory() as cache_dir:
+            generator.response_cache = ResponseCache(cache_dir)
+
+            first = generator.generate_qa_content("Some input", use_cache=True)
+            second = generator.generate_qa_content("Some input", use_cache=True)
+            uncached = generator.generate_qa_content("Some input", use_cache=False)
+
+        self.assertIn("Welcome to the show.", first)
+        self.assertEqual(second, first)
+        self.assertIn("Today we talk about caching.", uncached)
+
+    def test_stream_matches_generate(self):
+        # A scratchpad mentioning speaker tags, emphasis spanning turns and text after the
+        # last turn must clean as they do in the full transcript
+        transcript = (
+            "```scratchpad\nEnd on </Person2>, then <Person1> wraps up\n```\n"
+            "<Person1>Welcome [laughs] to the show.</Person1>\n"
+            "<Person2>Glad to *be </Person2>\n<Person1>here*.</Person1>\n"
+            "<Person2>Let's _start</Person2><Person1>now_.</Person1>\n"
+            "Thanks for listening"
+        )
+        generator = self.make_generator([transcript])
+        with tempfile.TemporaryDirectory() as output_dir:
+            output_filepath = os.path.join(output_dir, "transcript.txt")
+            pieces = list(generator.stream_qa_content("Some input", output_filepath=output_filepath))
+            with open(output_filepath) as f:
+                saved = f.read()
+
+        expected = self.make_generator([transcript]).generate_qa_content("Some input")
+        self.assertGreater(len(pieces), 1)
+        self.assertEqual("".join(pieces), expected)
+        self.assertEqual(saved, expected)
+        self.assertEqual(generator.response, expected)
+        self.assertNotIn("wraps up", expected)
+
+    def test_astream_matches_generate(self):
+        transcript = (
+            "<Person1>Welcome [laughs] to the show.</Person1>\n"
+            "<Person2>Glad to *be </Person2>\n<Person1>here*.</Person1>\nThanks"
+        )
+
+        async def collect(generator):
+            return [piece async for piece in generator.astream_qa_content("Some input")]
+
+        pieces = asyncio.run(collect(self.make_generator([transcript])))
+
+        self.assertGreater(len(pieces), 1)
+        self.assertEqual(
+            "".join(pieces), self.make_generator([transcript]).generate_qa_content("Some input")
+        )
+
+    def test_generate_batch_preserves_order(self):
+        generator = self.make_generator(RunnableLambda(echo_transcript))
+        inputs = [{"input_texts": f"Topic {i}"} for i in range(5)]
+
+        responses = generator.generate_qa_content_batch(inputs, max_concurrency=2)
+
+        self.assertEqual(
+            responses,
+            [generator.generate_qa_content(item["input_texts"]) for item in inputs],
+        )
+        self.assertIn("Topic 3", responses[3])
+
+    def test_generate_batch_builds_one_chain_for_local_models(self):
+        generator = self.make_generator(RunnableLambda(echo_transcript))
+        generator.is_local = True
+        inputs = [
+            {"input_texts": f"Topic {i}", "image_file_paths": ["image.png"] * i}
+            for i in range(3)
+        ]
+
+        with patch.object(
+            generator,
+            "_ContentGenerator__prepare_chain",
+            wraps=generator._ContentGenerator__prepare_chain,
+        ) as prepare_chain:
+            responses = generator.generate_qa_content_batch(inputs)
+
+        prepare_chain.assert_called_once_with(0, longform=False)
+        self.assertEqual(
+            responses,
+            [generator.generate_qa_content(item["input_texts"]) for item in inputs],
+        )
+
+    def test_agenerate_matches_generate(self):
+        generator = self.make_generator(RunnableLambda(echo_transcript))
+        with tempfile.TemporaryDirectory() as output_dir:
+            output_filepath = os.path.join(output_dir, "transcript.txt")
+            response = asyncio.run(
+                generator.agenerate_qa_content("Async topic", output_filepath=output_filepath)
+            )
+            with open(output_filepath) as f:
+                saved = f.read()
+
+        self.assertEqual(response, generator.generate_qa_content("Async topic"))
+        self.assertEqual(saved, response)
+
+    def test_agenerate_batch_preserves_order_and_bounds_concurrency(self):
+        in_flight = []
+        peak = []
+
+        async def slow_echo(prompt_value):
+            in_flight.append(prompt_value)
+            peak.append(len(in_flight))
+            await asyncio.sleep(0.01)
+            in_flight.remove(prompt_value)
+            return echo_transcript(prompt_value)
+
+        generator = self.make_generator(RunnableLambda(echo_transcript, afunc=slow_echo))
+        inputs = [{"input_texts": f"Topic {i}"} for i in range(6)]
+
+        responses = asyncio.run(generator.agenerate_qa_content_batch(inputs, max_concurrency=2))
+
+        self.assertEqual(
+            responses,
+            [generator.generate_qa_content(item["input_texts"]) for item in inputs],
+        )
+        self.assertEqual(max(peak), 2)
+
+
+class TestCachedChain(unittest.TestCase):
+    def setUp(self):
+        self.prompt = ChatPromptTemplate.from_messages([("human", "Talk about {input_text}")])
+        self.calls = []
+
+        def respond(prompt_params):
+            self.calls.append(prompt_params["input_text"])
+            return f"response {len(self.calls)}"
+
+        def stream(inputs):
+            for prompt_params in inputs:
+                self.calls.append(prompt_params["input_text"])
+                yield "chunk 1, "
+                yield "chunk 2"
+
+        async def astream(inputs):
+            async for prompt_params in inputs:
+                self.calls.append(prompt_params["input_text"])
+                yield "chunk 1, "
+                yield "chunk 2"
+
+        self.invoke_chain = CachedChain(
+            RunnableLambda(respond), self.prompt, MemoryCache(), "test-model", 0
+        )
+        self.stream_chain = CachedChain(
+            RunnableGenerator(stream, astream), self.prompt, MemoryCache(), "test-model", 0
+        )
+
+    def test_invoke_reuses_response(self):
+        first = self.invoke_chain.invoke({"input_text": "caching"})
+        self.assertEqual(self.invoke_chain.invoke({"input_text": "caching"}), first)
+        self.assertEqual(asyncio.run(self.invoke_chain.ainvoke({"input_text": "caching"})), first)
+        self.assertEqual(len(self.calls), 1)
+
+    def test_key_keeps_whitespace(self):
+        # The model sees whitespace, so prompts differing only in layout are not merged
+        first = self.invoke_chain.invoke({"input_text": "caching\n\n  layers"})
+        self.assertNotEqual(self.invoke_chain.invoke({"input_text": "caching layers"}), first)
+        self.assertEqual(len(self.calls), 2)
+
+    def test_key_includes_model_and_temperature(self):
+        params = {"input_text": "caching"}
+        keys = {
+            CachedChain(None, self.prompt, MemoryCache(), model_name, temperature)._key(params)
+            for model_name, temperature in [("test-model", 0), ("other-model", 0), ("test-model", 1)]
+        }
+        self.assertEqual(len(keys), 3)
+
+    def test_batch_only_sends_misses(self):
+        self.invoke_chain.invoke({"input_text": "cached"})
+        responses = self.invoke_chain.batch([{"input_text": "cached"}, {"input_text": "new"}])
+
+        self.assertEqual(responses, ["response 1", "response 2"])
+        self.assertEqual(self.calls, ["cached", "new"])
+
+    def test_stream_replays_cached_output(self):
+        streamed = list(self.stream_chain.stream({"input_text": "caching"}))
+        replayed = list(self.stream_chain.stream({"input_text": "caching"}))
+
+        self.assertEqual(streamed, ["chunk 1, ", "chunk 2"])
+        self.assertEqual(replayed, ["chunk 1, chunk 2"])
+        self.assertEqual(len(self.calls), 1)
+
+    def test_astream_replays_cached_output(self):
+        async def collect():
+            return [chunk async for chunk in self.stream_chain.astream({"input_text": "caching"})]
+
+        self.assertEqual(asyncio.run(collect()), ["chunk 1, ", "chunk 2"])
+        self.assertEqual(asyncio.run(collect()), ["chunk 1, chunk 2"])
+        self.assertEqual(len(self.calls), 1)
+
+
+
+class TestCleanTSSMarkup(unittest.TestCase):
+    @staticmethod
+    def baseline_clean_tss_markup(input_text, additional_tags=["Person1", "Person2"]):
+        """The cleaner as it was before chunk6-15, with one pass per pattern and speaker tag."""
+        input_text = ContentCleanerMixin._clean_scratchpad(input_text)
+        supported_tags = ["speak", "lang", "p", "phoneme", "s", "sub"] + additional_tags
+        pattern = r"</?(?!(?:" + "|".join(supported_tags) + r")\b)[^>]+>"
+        cleaned_text = re.sub(pattern, "", input_text)
+        cleaned_text = re.sub(r"\n\s*\n", "\n", cleaned_text)
+        cleaned_text = re.sub(r"\*", "", cleaned_text)
+        for tag in additional_tags:
+            cleaned_text = re.sub(
+                f'<{tag}>(.*?)(?=<(?:{"|".join(additional_tags)})>|$)',
+                f"<{tag}>\\1</{tag}>",
+                cleaned_text,
+                flags=re.DOTALL,
+            )
+        return cleaned_text.strip()
+
+    def test_matches_baseline_cleaner(self):
+        rng = random.Random(0)
+        for _ in range(5000):
+            text = "".join(rng.choices(MARKUP_TOKENS, k=rng.randint(0, 30)))
+            self.assertEqual(
+                ContentCleanerMixin._clean_tss_markup(text), self.baseline_clean_tss_markup(text), text
+            )
+
+
+class TestTranscriptStreamCleaner(unittest.TestCase):
+    def test_pieces_join_to_cleaned_transcript(self):
+        strategy = StandardContentStrategy(None, {}, {})
+        rng = random.Random(0)
+        for _ in range(2000):
+            text = "".join(rng.choices(MARKUP_TOKENS, k=rng.randint(0, 40)))
+            cleaner = TranscriptStreamCleaner(strategy, {})
+            pieces = []
+            start = 0
+            while start < len(text):
+                end = start + rng.randint(1, 12)
+                pieces.append(cleaner.feed(text[start:end]))
+                start = end
+            pieces.append(cleaner.finish())
+
+            self.assertEqual("".join(pieces), strategy.clean(text, {}), text)
+
+class TestLLMBackendCache(unittest.TestCase):
+    def setUp(self):
+        content_generator._cached_llm_backend.cache_clear()
+        self.addCleanup(content_generator._cached_llm_backend.cache_clear)
+        backend_patcher = patch.object(
+            content_generator, "LLMBackend", side_effect=lambda **kwargs: object()
+        )
+        backend_patcher.start()
+        self.addCleanup(backend_patcher.stop)
+
+    def get_backend(self):
+        return content_generator.get_llm_backend(
+            is_local=False,
+            temperature=1,
+            max_output_tokens=8192,
+            model_name="openai/gpt-4o-mini",
+            api_key_label="TEST_API_KEY",
+        )
+
+    def test_backend_reused_for_same_key(self):
+        with patch.dict(os.environ, {"TEST_API_KEY": "key-1"}):
+            self.assertIs(self.get_backend(), self.get_backend())
+
+    def test_backend_rebuilt_for_rotated_key(self):
+        with patch.dict(os.environ, {"TEST_API_KEY": "key-1"}):
+            first = self.get_backend()
+        with patch.dict(os.environ, {"TEST_API_KEY": "key-2"}):
+            self.assertIsNot(self.get_backend(), first)
+
+
+if __name__ == "__main__":
+    unittest.main()
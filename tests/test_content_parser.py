@@ -1,10 +1,15 @@
+import asyncio
+import os
+import tempfile
 import unittest
 import pytest
+from unittest.mock import patch
 from podcastfy.utils.config import load_config
 from podcastfy.content_parser.content_extractor import ContentExtractor
 from podcastfy.content_parser.youtube_transcriber import YouTubeTranscriber
 from podcastfy.content_parser.website_extractor import WebsiteExtractor
 from podcastfy.content_parser.pdf_extractor import PDFExtractor
+from podcastfy.utils.cache import ResponseCache
 
 
 class TestContentParser(unittest.TestCase):
@@ -104,5 +109,60 @@ class TestContentParser(unittest.TestCase):
         )
 
 
+class TestContentExtractorCache(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.extractor = ContentExtractor()
+        self.extractor.cache = ResponseCache(self.temp_dir.name)
+        self.url = "https://example.com/article"
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_remote_cache_disabled_by_default(self):
+        with patch.object(ContentExtractor, "_extract_content", return_value="content") as extract:
+            self.extractor.extract_content(self.url)
+            self.extractor.extract_content(self.url)
+        self.assertEqual(extract.call_count, 2)
+
+    def test_remote_cache_within_ttl(self):
+        self.extractor.cache_ttl = 3600
+        with patch.object(ContentExtractor, "_extract_content", return_value="content") as extract:
+            self.assertEqual(self.extractor.extract_content(self.url), "content")
+            self.assertEqual(self.extractor.extract_content(self.url), "content")
+            self.assertEqual(extract.call_count, 1)
+
+            self.extractor.extract_content(self.url, use_cache=False)
+            self.assertEqual(extract.call_count, 2)
+
+    def test_local_cache_shared_across_extractors(self):
+        path = os.path.join(self.temp_dir.name, "notes.txt")
+        with open(path, "w") as f:
+            f.write("first")
+
+        with patch.object(ContentExtractor, "_extract_content", return_value="content") as extract:
+            ContentExtractor().extract_content(path)
+            ContentExtractor().extract_content(path)
+            self.assertEqual(extract.call_count, 1)
+
+            # A modified file is extracted again
+            with open(path, "w") as f:
+                f.write("second version")
+            ContentExtractor().extract_content(path)
+            self.assertEqual(extract.call_count, 2)
+
+
+class TestContentExtractorConcurrency(unittest.TestCase):
+    def test_extract_contents_preserves_order(self):
+        sources = ["https://example.com/a", "paper.pdf", "https://example.com/b"]
+        extractor = ContentExtractor()
+        with patch.object(
+            ContentExtractor, "extract_content", side_effect=lambda source: f"content of {source}"
+        ):
+            expected = [f"content of {source}" for source in sources]
+            self.assertEqual(extractor.extract_contents(sources), expected)
+            self.assertEqual(asyncio.run(extractor.aextract_contents(sources)), expected)
+
+
 if __name__ == "__main__":
     unittest.main()